@@ -262,19 +262,44 @@ async def update_project(project_id: str, update_data: dict):
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.delete("/projects/{project_id}")
-async def delete_project(project_id: str):
-    """Delete a project"""
+async def delete_project(project_id: str, return_list: bool = False):
+    """Delete a project, optionally returning the updated projects list"""
     try:
         deleted = await db_service.delete_project(project_id)
         if not deleted:
             raise HTTPException(status_code=404, detail="Project not found")
-        return {"success": True, "message": "Project deleted successfully"}
+        response = {"success": True, "message": "Project deleted successfully"}
+        if return_list:
+            # Lets callers verify the deletion without a second round-trip
+            result = await db_service.list_projects()
+            response["projects"] = result["projects"]
+            response["total"] = result["total"]
+        return response
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error deleting project {project_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@api_router.post("/projects/_test_seed")
+async def seed_test_project(request: dict):
+    """Insert a minimal project without calling an AI provider (test runs only)"""
+    if os.environ.get("ENABLE_TEST_ROUTES", "").lower() not in ("1", "true", "yes"):
+        raise HTTPException(status_code=404, detail="Not Found")
+    try:
+        project_id = str(uuid.uuid4())
+        await db_service.save_project({
+            "session_id": project_id,
+            "files": request.get("files", {}),
+            "website_type": request.get("website_type", "landing"),
+            "provider": "test",
+            "metadata": {"prompt": request.get("name", "Test project")}
+        })
+        return {"success": True, "project_id": project_id}
+    except Exception as e:
+        logger.error(f"Error seeding test project: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @api_router.post("/enhance-project")
 async def enhance_project(request: dict):
     """Enhance a project using AI suggestions"""
@@ -401,6 +426,33 @@ async def enhance_project(request: dict):
         logger.error(f"Error enhancing project: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Every job is a paid LLM call and a batch runs them all at once, so its size is capped
+MAX_BATCH_JOBS = 8
+
+@api_router.post("/enhance-project-batch")
+async def enhance_project_batch(request: dict):
+    """Run several enhance-project jobs concurrently, returning their results in request order"""
+    jobs = request.get("batch")
+    if not isinstance(jobs, list) or not jobs or not all(isinstance(job, dict) for job in jobs):
+        return {"success": False, "error": "batch must be a non-empty list of enhancement jobs"}
+    if len(jobs) > MAX_BATCH_JOBS:
+        return {"success": False, "error": f"batch is limited to {MAX_BATCH_JOBS} jobs, got {len(jobs)}"}
+
+    # Fields outside the batch (project_id, current_content, apply, ...) are shared by every job,
+    # which may override them. Applied jobs on the same project_id each overwrite its stored files
+    shared = {k: v for k, v in request.items() if k != "batch"}
+    logger.info(f"Enhancing batch of {len(jobs)} jobs")
+
+    results = await asyncio.gather(
+        *(enhance_project({**shared, **job}) for job in jobs),
+        return_exceptions=True
+    )
+    results = [
+        r if isinstance(r, dict) else {"success": False, "error": getattr(r, "detail", str(r))}
+        for r in results
+    ]
+    return {"success": all(r.get("success") for r in results), "results": results}
+
 async def generate_smart_suggestions(content: str):
     """Generate intelligent enhancement suggestions based on content analysis"""
     suggestions = []
@@ -763,7 +815,7 @@ IMPORTANTE: Los cambios deben ser significativos, visibles y profesionales. Inte
 # TEMPLATE SYSTEM ENDPOINTS
 # ================================
 
-@api_router.get("/templates")
+@api_router.api_route("/templates", methods=["GET", "HEAD"])
 async def get_templates():
     """Get available website templates"""
     return {
@@ -831,7 +883,7 @@ async def generate_from_template(template_id: str, customization: dict):
 # LEGACY ENDPOINTS (for compatibility)
 # ================================
 
-@api_router.get("/")
+@api_router.api_route("/", methods=["GET", "HEAD"])
 async def root():
     return {
         "message": "Professional Website Generator API",
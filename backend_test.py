@@ -5,16 +5,86 @@ Tests all backend APIs, AI integration, and database operations
 """
 
 import asyncio
-import json
 import os
 import sys
-import requests
-from datetime import datetime
-from typing import Dict, Any, List
+import aiohttp
+import orjson
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Set
 
 # Add backend to path for imports
 sys.path.append('/app/backend')
 
+async def _json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a buffered JSON response body with orjson"""
+    return await response.json(loads=orjson.loads)
+
+def _index_files(files) -> Dict[str, str]:
+    """Map filename to content for either project files shape.
+
+    Handles both the list-of-dicts shape stored in the database and the
+    dict-of-name→content shape returned by the generator, so every check
+    on a response is a dict lookup over one pass of the files.
+    """
+    if isinstance(files, dict):
+        return files
+    if isinstance(files, list):
+        return {f.get("filename", ""): f.get("content", "") for f in files if isinstance(f, dict)}
+    return {}
+
+def _file_exts(files, non_empty: bool = True) -> Set[str]:
+    """Collect the lowercase extensions of a project's files, by default only those with content"""
+    return {Path(name).suffix.lower().lstrip('.') for name, content in _index_files(files).items()
+            if content or not non_empty}
+
+# Providers and website types exercised by the generation matrix
+GENERATION_PROVIDERS = {"openai": "OpenAI", "gemini": "Gemini"}
+GENERATION_PROMPTS = {
+    "landing": "Create a professional landing page for a modern tech startup called 'InnovateTech' that specializes in AI solutions",
+    "business": "Create a professional business website for a consulting firm called 'Strategic Solutions' with services and team sections",
+    "portfolio": "Create a professional portfolio website for a photographer showcasing landscape and portrait work",
+    "ecommerce": "Create a professional online store for a boutique coffee roaster selling beans and brewing equipment",
+    "blog": "Create a professional blog for a software engineer writing about web development and cloud architecture",
+}
+
+# Connection setup gets a short timeout of its own so a down backend fails fast;
+# per-call timeouts only bound the wait for the response
+CONNECT_TIMEOUT = 2.0
+
+# Transient upstream failures on generate-website are retried with exponential backoff
+GENERATION_RETRY_ATTEMPTS = 3
+GENERATION_RETRY_START = 2  # seconds before the first retry
+GENERATION_RETRY_MAX = 30  # cap on the delay between retries
+GENERATION_RETRY_STATUSES = {502, 503}
+
+# Page saved by the editor update test; {timestamp} makes every run's content unique
+_EDITOR_TEST_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Test Editor Update</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; background: #f0f0f0; padding: 2rem; }}
+        .container {{ background: white; padding: 2rem; border-radius: 10px; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🎨 Editor Test Update</h1>
+        <p>This content was updated via the Dual Code Editor backend test.</p>
+        <p>Timestamp: {timestamp}</p>
+    </div>
+</body>
+</html>"""
+
+# Static part of the editor update payload
+_BASE_UPDATE_DATA = {
+    "description": "Updated via editor test"
+}
+
 class BackendTester:
     def __init__(self):
         # Get backend URL from frontend env
@@ -27,34 +97,111 @@ class BackendTester:
         self.api_url = f"{self.base_url}/api"
         self.test_results = []
         
-        print(f"🔧 Testing Backend API at: {self.api_url}")
-        print("=" * 60)
+        # Shared aiohttp session, opened for the duration of run_all_tests
+        self.session: aiohttp.ClientSession = None
+        
+        # Projects read back within one run; writes invalidate the affected entries
+        self._projects_cache = None
+        self._project_cache = {}
+        
+        # Results are ordered by a monotonic clock; wall-clock time is only
+        # derived from this anchor when the report is written
+        self.t0_wall = datetime.now()
+        self.t0_mono_ns = time.monotonic_ns()
+        
+        # Console output is buffered so concurrent tests don't interleave
+        self._output = []
+        
+        self._print(f"🔧 Testing Backend API at: {self.api_url}")
+        self._print("=" * 60)
+
+    def _print(self, text: str = ""):
+        """Buffer a line of console output until the summary is written"""
+        self._output.append(text)
+
+    def _flush_output(self):
+        """Write all buffered console output in one go"""
+        sys.stdout.write("\n".join(self._output) + "\n")
+        sys.stdout.flush()
+        self._output.clear()
+
+    def _wall_iso(self, ts_ns: int) -> str:
+        """Convert a monotonic log timestamp to an ISO wall-clock timestamp"""
+        return (self.t0_wall + timedelta(microseconds=(ts_ns - self.t0_mono_ns) / 1000)).isoformat()
+
+    async def _request(self, method: str, url: str, timeout: float, **kwargs) -> aiohttp.ClientResponse:
+        """Issue a request on the shared session and read the body before releasing the connection"""
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=CONNECT_TIMEOUT, sock_read=timeout)
+        if "json" in kwargs:
+            # Encode bodies with orjson rather than aiohttp's stdlib json.dumps
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {"Content-Type": "application/json", **kwargs.get("headers", {})}
+        async with self.session.request(method, url, timeout=timeout, **kwargs) as response:
+            await response.read()
+            return response
+
+    async def _get_projects(self, force: bool = False):
+        """GET /projects, reusing the last successful response unless forced"""
+        if force or self._projects_cache is None:
+            response = await self._request("GET", f"{self.api_url}/projects", timeout=10)
+            if response.status != 200:
+                return response.status, await response.text()
+            self._projects_cache = await _json(response)
+        return 200, self._projects_cache
+
+    async def _get_project(self, project_id: str, force: bool = False):
+        """GET /projects/{id}, reusing the last successful response unless forced"""
+        if force or project_id not in self._project_cache:
+            response = await self._request("GET", f"{self.api_url}/projects/{project_id}", timeout=10)
+            if response.status != 200:
+                return response.status, await response.text()
+            self._project_cache[project_id] = await _json(response)
+        return 200, self._project_cache[project_id]
+
+    async def _post_generate(self, payload: Dict[str, Any], timeout: int = 60):
+        """POST to /generate-website, retrying 502/503 responses and failed connection attempts"""
+        delay = GENERATION_RETRY_START
+        for attempt in range(1, GENERATION_RETRY_ATTEMPTS + 1):
+            try:
+                response = await self._request("POST", f"{self.api_url}/generate-website", 
+                                               json=payload, timeout=timeout)
+            # Only a connection that was never opened is retried. A read timeout, a dropped
+            # connection or a 504 usually means the backend is already generating the site
+            except aiohttp.ClientConnectorError:
+                if attempt == GENERATION_RETRY_ATTEMPTS:
+                    raise
+            else:
+                if response.status == 200:
+                    # A new project may have been saved
+                    self._projects_cache = None
+                if response.status not in GENERATION_RETRY_STATUSES or attempt == GENERATION_RETRY_ATTEMPTS:
+                    return response
+            
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, GENERATION_RETRY_MAX)
 
     def log_test(self, test_name: str, success: bool, details: str = "", error: str = ""):
         """Log test results"""
         status = "✅ PASS" if success else "❌ FAIL"
-        self.test_results.append({
-            "test": test_name,
-            "success": success,
-            "details": details,
-            "error": error,
-            "timestamp": datetime.now().isoformat()
-        })
-        
-        print(f"{status} {test_name}")
+        # Rows stay plain tuples; dicts are only built for the JSON report
+        self.test_results.append((test_name, success, details, error, time.monotonic_ns()))
+        
+        lines = [f"{status} {test_name}"]
         if details:
-            print(f"   📝 {details}")
+            lines.append(f"   📝 {details}")
         if error:
-            print(f"   ⚠️  {error}")
-        print()
+            lines.append(f"   ⚠️  {error}")
+        lines.append("")
+        # Append the whole block at once so concurrent tests keep their lines together
+        self._print("\n".join(lines))
 
-    def test_api_root(self):
+    async def test_api_root(self):
         """Test API root endpoint"""
         try:
-            response = requests.get(f"{self.api_url}/", timeout=10)
+            response = await self._request("GET", f"{self.api_url}/", timeout=10)
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = await _json(response)
                 if "Professional Website Generator API" in data.get("message", ""):
                     self.log_test("API Root Endpoint", True, 
                                 f"Version: {data.get('version', 'unknown')}")
@@ -63,18 +210,18 @@ class BackendTester:
                                 error="Invalid response format")
             else:
                 self.log_test("API Root Endpoint", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
+                            error=f"HTTP {response.status}: {await response.text()}")
                 
         except Exception as e:
             self.log_test("API Root Endpoint", False, error=str(e))
 
-    def test_ai_providers_endpoint(self):
+    async def test_ai_providers_endpoint(self):
         """Test AI providers configuration endpoint"""
         try:
-            response = requests.get(f"{self.api_url}/ai-providers", timeout=10)
+            response = await self._request("GET", f"{self.api_url}/ai-providers", timeout=10)
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = await _json(response)
                 providers = data.get("providers", [])
                 
                 # Check if both OpenAI and Gemini are configured
@@ -91,18 +238,18 @@ class BackendTester:
                                 error=f"Missing providers. Found: {provider_ids}")
             else:
                 self.log_test("AI Providers Configuration", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
+                            error=f"HTTP {response.status}: {await response.text()}")
                 
         except Exception as e:
             self.log_test("AI Providers Configuration", False, error=str(e))
 
-    def test_website_types_endpoint(self):
+    async def test_website_types_endpoint(self):
         """Test website types endpoint"""
         try:
-            response = requests.get(f"{self.api_url}/website-types", timeout=10)
+            response = await self._request("GET", f"{self.api_url}/website-types", timeout=10)
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = await _json(response)
                 types = data.get("types", [])
                 
                 # Check if all 5 website types are available
@@ -118,96 +265,60 @@ class BackendTester:
                                 error=f"Missing types: {missing}")
             else:
                 self.log_test("Website Types Endpoint", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
+                            error=f"HTTP {response.status}: {await response.text()}")
                 
         except Exception as e:
             self.log_test("Website Types Endpoint", False, error=str(e))
 
-    def test_website_generation_openai(self):
-        """Test website generation with OpenAI"""
+    async def _gen(self, provider: str, website_type: str):
+        """Generate one website type with one provider and validate the files"""
+        test_name = f"{GENERATION_PROVIDERS[provider]} Website Generation ({website_type})"
         try:
             payload = {
-                "prompt": "Create a professional landing page for a modern tech startup called 'InnovateTech' that specializes in AI solutions",
-                "website_type": "landing",
-                "provider": "openai"
+                "prompt": GENERATION_PROMPTS[website_type],
+                "website_type": website_type,
+                "provider": provider
             }
             
-            response = requests.post(f"{self.api_url}/generate-website", 
-                                   json=payload, timeout=60)
+            response = await self._post_generate(payload, timeout=60)
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = await _json(response)
                 
                 if data.get("success"):
                     files = data.get("files", {})
                     metadata = data.get("metadata", {})
                     
-                    # Check if essential files are generated
-                    has_html = any("html" in f.lower() for f in files.keys())
-                    has_css = any("css" in f.lower() for f in files.keys())
+                    # Check if essential files are generated (by name only, an empty file still counts)
+                    exts = _file_exts(files, non_empty=False)
                     
-                    if has_html and has_css:
+                    if "html" in exts and "css" in exts:
                         details = f"Generated {len(files)} files, Provider: {metadata.get('provider')}"
-                        self.log_test("OpenAI Website Generation", True, details)
+                        self.log_test(test_name, True, details)
                         return data  # Return for further testing
                     else:
-                        self.log_test("OpenAI Website Generation", False, 
+                        self.log_test(test_name, False, 
                                     error="Missing essential files (HTML/CSS)")
                 else:
-                    self.log_test("OpenAI Website Generation", False, 
+                    self.log_test(test_name, False, 
                                 error=data.get("error", "Generation failed"))
             else:
-                self.log_test("OpenAI Website Generation", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
+                self.log_test(test_name, False, 
+                            error=f"HTTP {response.status}: {await response.text()}")
                 
         except Exception as e:
-            self.log_test("OpenAI Website Generation", False, error=str(e))
+            self.log_test(test_name, False, error=str(e))
         
         return None
 
-    def test_website_generation_gemini(self):
-        """Test website generation with Gemini"""
-        try:
-            payload = {
-                "prompt": "Create a professional business website for a consulting firm called 'Strategic Solutions' with services and team sections",
-                "website_type": "business", 
-                "provider": "gemini"
-            }
-            
-            response = requests.post(f"{self.api_url}/generate-website", 
-                                   json=payload, timeout=60)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if data.get("success"):
-                    files = data.get("files", {})
-                    metadata = data.get("metadata", {})
-                    
-                    # Check if essential files are generated
-                    has_html = any("html" in f.lower() for f in files.keys())
-                    has_css = any("css" in f.lower() for f in files.keys())
-                    
-                    if has_html and has_css:
-                        details = f"Generated {len(files)} files, Provider: {metadata.get('provider')}"
-                        self.log_test("Gemini Website Generation", True, details)
-                        return data  # Return for further testing
-                    else:
-                        self.log_test("Gemini Website Generation", False, 
-                                    error="Missing essential files (HTML/CSS)")
-                else:
-                    self.log_test("Gemini Website Generation", False, 
-                                error=data.get("error", "Generation failed"))
-            else:
-                self.log_test("Gemini Website Generation", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("Gemini Website Generation", False, error=str(e))
-        
-        return None
+    async def test_website_generation_matrix(self):
+        """Test website generation for every provider × website type concurrently"""
+        matrix = [(p, t) for p in GENERATION_PROVIDERS for t in GENERATION_PROMPTS]
+        results = await asyncio.gather(*[self._gen(p, t) for p, t in matrix],
+                                       return_exceptions=True)
+        return dict(zip(matrix, results))
 
-    def test_provider_comparison(self):
+    async def test_provider_comparison(self):
         """Test provider comparison mode"""
         try:
             payload = {
@@ -216,11 +327,10 @@ class BackendTester:
                 "provider": None  # This triggers comparison mode
             }
             
-            response = requests.post(f"{self.api_url}/generate-website", 
-                                   json=payload, timeout=120)  # Longer timeout for comparison
+            response = await self._post_generate(payload, timeout=120)  # Longer timeout for comparison
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = await _json(response)
                 
                 if data.get("success"):
                     results = data.get("results", {})
@@ -251,21 +361,19 @@ class BackendTester:
                                 error=data.get("error", "Comparison failed"))
             else:
                 self.log_test("Provider Comparison Mode", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
+                            error=f"HTTP {response.status}: {await response.text()}")
                 
         except Exception as e:
             self.log_test("Provider Comparison Mode", False, error=str(e))
         
         return None
 
-    def test_projects_list(self):
+    async def test_projects_list(self):
         """Test projects listing endpoint"""
         try:
-            response = requests.get(f"{self.api_url}/projects", timeout=10)
+            status, data = await self._get_projects()
             
-            if response.status_code == 200:
-                data = response.json()
-                
+            if status == 200:
                 if "projects" in data and "total" in data:
                     total_projects = data.get("total", 0)
                     projects_count = len(data.get("projects", []))
@@ -279,14 +387,14 @@ class BackendTester:
                                 error="Invalid response format")
             else:
                 self.log_test("Projects List Endpoint", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
+                            error=f"HTTP {status}: {data}")
                 
         except Exception as e:
             self.log_test("Projects List Endpoint", False, error=str(e))
         
         return []
 
-    def test_project_retrieval(self, projects: List[Dict]):
+    async def test_project_retrieval(self, projects: List[Dict]):
         """Test individual project retrieval"""
         if not projects:
             self.log_test("Project Retrieval", False, error="No projects available to test")
@@ -301,11 +409,9 @@ class BackendTester:
                 self.log_test("Project Retrieval", False, error="Project missing ID")
                 return
             
-            response = requests.get(f"{self.api_url}/projects/{project_id}", timeout=10)
+            status, data = await self._get_project(project_id)
             
-            if response.status_code == 200:
-                data = response.json()
-                
+            if status == 200:
                 if data.get("id") == project_id:
                     files_count = len(data.get("files", []))
                     details = f"Retrieved project {project_id[:8]}... with {files_count} files"
@@ -313,35 +419,35 @@ class BackendTester:
                 else:
                     self.log_test("Project Retrieval", False, 
                                 error="Project ID mismatch")
-            elif response.status_code == 404:
+            elif status == 404:
                 self.log_test("Project Retrieval", False, 
                             error="Project not found (404)")
             else:
                 self.log_test("Project Retrieval", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
+                            error=f"HTTP {status}: {data}")
                 
         except Exception as e:
             self.log_test("Project Retrieval", False, error=str(e))
 
-    def test_project_deletion_functionality(self):
+    async def test_project_deletion_functionality(self):
         """Test project deletion functionality comprehensively"""
-        print("🗑️  TESTING PROJECT DELETION FUNCTIONALITY")
-        print("-" * 50)
+        self._print("🗑️  TESTING PROJECT DELETION FUNCTIONALITY")
+        self._print("-" * 50)
         
         # First, get current projects list
-        initial_projects = self.get_projects_for_testing()
+        initial_projects = await self.get_projects_for_testing()
         initial_count = len(initial_projects)
         
         if initial_count == 0:
             # Create a test project first
-            test_project = self.create_test_project_for_deletion()
+            test_project = await self.create_test_project_for_deletion()
             if not test_project:
                 self.log_test("Project Deletion Setup", False, 
                             error="Could not create test project for deletion testing")
                 return
             
             # Refresh projects list
-            initial_projects = self.get_projects_for_testing()
+            initial_projects = await self.get_projects_for_testing()
             initial_count = len(initial_projects)
         
         if initial_count == 0:
@@ -349,30 +455,41 @@ class BackendTester:
                         error="No projects available for deletion testing")
             return
         
-        # Test 1: Delete existing project
-        self.test_delete_existing_project(initial_projects[0])
+        # Test 1: Delete existing project (the response carries the updated list)
+        deletion_data = await self.test_delete_existing_project(initial_projects[0])
+        self._projects_cache = None
+        self._project_cache.pop(initial_projects[0]["id"], None)
+        
+        # Backends without return_list support need one list call shared by both checks
+        if deletion_data and "projects" in deletion_data:
+            projects_data = deletion_data
+        else:
+            projects_data = await self.get_projects_data(force=True)
         
         # Test 2: Verify deletion in database (check projects list)
-        self.test_verify_deletion_in_database(initial_projects[0]["id"], initial_count)
+        await self.test_verify_deletion_in_database(initial_projects[0]["id"], initial_count, projects_data)
         
         # Test 3: Test deletion of non-existent project (404 error)
-        self.test_delete_nonexistent_project()
+        await self.test_delete_nonexistent_project()
         
-        # Test 4: Test GET /api/projects after deletion
-        self.test_projects_list_after_deletion(initial_count - 1)
+        # Test 4: Test projects list after deletion
+        await self.test_projects_list_after_deletion(initial_count - 1, projects_data)
 
-    def get_projects_for_testing(self):
-        """Get projects list for testing purposes"""
+    async def get_projects_data(self, force: bool = False):
+        """Get the raw projects list response for testing purposes"""
         try:
-            response = requests.get(f"{self.api_url}/projects", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("projects", [])
+            status, data = await self._get_projects(force)
+            if status == 200:
+                return data
         except Exception:
             pass
-        return []
+        return {}
 
-    def create_test_project_for_deletion(self):
+    async def get_projects_for_testing(self):
+        """Get projects list for testing purposes"""
+        return (await self.get_projects_data()).get("projects", [])
+
+    async def create_test_project_for_deletion(self):
         """Create a test project specifically for deletion testing"""
         try:
             payload = {
@@ -381,50 +498,50 @@ class BackendTester:
                 "provider": "openai"
             }
             
-            response = requests.post(f"{self.api_url}/generate-website", 
-                                   json=payload, timeout=60)
+            response = await self._post_generate(payload, timeout=60)
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = await _json(response)
                 if data.get("success"):
                     return data
         except Exception as e:
-            print(f"Error creating test project: {e}")
+            self._print(f"Error creating test project: {e}")
         
         return None
 
-    def test_delete_existing_project(self, project):
+    async def test_delete_existing_project(self, project):
         """Test DELETE /api/projects/{project_id} endpoint"""
         try:
             project_id = project.get("id")
             project_name = project.get("name", "Unknown")
             
-            response = requests.delete(f"{self.api_url}/projects/{project_id}", timeout=10)
+            response = await self._request("DELETE", f"{self.api_url}/projects/{project_id}", 
+                                           params={"return_list": 1}, timeout=10)
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = await _json(response)
                 
                 if data.get("success") and "deleted successfully" in data.get("message", ""):
                     details = f"Successfully deleted project '{project_name}' (ID: {project_id[:8]}...)"
                     self.log_test("DELETE Project Endpoint", True, details)
-                    return True
+                    return data
                 else:
                     self.log_test("DELETE Project Endpoint", False, 
                                 error=f"Invalid response format: {data}")
             else:
                 self.log_test("DELETE Project Endpoint", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
+                            error=f"HTTP {response.status}: {await response.text()}")
                 
         except Exception as e:
             self.log_test("DELETE Project Endpoint", False, error=str(e))
         
-        return False
+        return None
 
-    def test_verify_deletion_in_database(self, deleted_project_id, initial_count):
+    async def test_verify_deletion_in_database(self, deleted_project_id, initial_count, projects_data):
         """Verify that project was actually deleted from database"""
         try:
             # Check projects list
-            current_projects = self.get_projects_for_testing()
+            current_projects = projects_data.get("projects", [])
             current_count = len(current_projects)
             
             # Verify count decreased
@@ -445,15 +562,15 @@ class BackendTester:
         except Exception as e:
             self.log_test("Database Deletion Verification", False, error=str(e))
 
-    def test_delete_nonexistent_project(self):
+    async def test_delete_nonexistent_project(self):
         """Test deletion of non-existent project (should return 404)"""
         try:
             fake_project_id = "nonexistent-project-id-12345"
             
-            response = requests.delete(f"{self.api_url}/projects/{fake_project_id}", timeout=10)
+            response = await self._request("DELETE", f"{self.api_url}/projects/{fake_project_id}", timeout=10)
             
-            if response.status_code == 404:
-                data = response.json()
+            if response.status == 404:
+                data = await _json(response)
                 if "not found" in data.get("detail", "").lower():
                     details = f"Correctly returned 404 for non-existent project ID"
                     self.log_test("Delete Non-existent Project (404)", True, details)
@@ -462,40 +579,32 @@ class BackendTester:
                                 error="404 returned but wrong error message")
             else:
                 self.log_test("Delete Non-existent Project (404)", False, 
-                            error=f"Expected 404, got HTTP {response.status_code}: {response.text}")
+                            error=f"Expected 404, got HTTP {response.status}: {await response.text()}")
                 
         except Exception as e:
             self.log_test("Delete Non-existent Project (404)", False, error=str(e))
 
-    def test_projects_list_after_deletion(self, expected_count):
-        """Test GET /api/projects after deletion to confirm list updates"""
+    async def test_projects_list_after_deletion(self, expected_count, data):
+        """Test the projects list after deletion to confirm it updates"""
         try:
-            response = requests.get(f"{self.api_url}/projects", timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
+            if "projects" in data and "total" in data:
+                actual_count = data.get("total", 0)
+                projects_shown = len(data.get("projects", []))
                 
-                if "projects" in data and "total" in data:
-                    actual_count = data.get("total", 0)
-                    projects_shown = len(data.get("projects", []))
-                    
-                    if actual_count == expected_count:
-                        details = f"Projects list correctly updated: {actual_count} total, showing {projects_shown}"
-                        self.log_test("Projects List After Deletion", True, details)
-                    else:
-                        self.log_test("Projects List After Deletion", False, 
-                                    error=f"Expected {expected_count} projects, found {actual_count}")
+                if actual_count == expected_count:
+                    details = f"Projects list correctly updated: {actual_count} total, showing {projects_shown}"
+                    self.log_test("Projects List After Deletion", True, details)
                 else:
                     self.log_test("Projects List After Deletion", False, 
-                                error="Invalid response format")
+                                error=f"Expected {expected_count} projects, found {actual_count}")
             else:
                 self.log_test("Projects List After Deletion", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
+                            error="Invalid or missing projects list response")
                 
         except Exception as e:
             self.log_test("Projects List After Deletion", False, error=str(e))
 
-    def test_database_connectivity(self):
+    async def test_database_connectivity(self):
         """Test database connectivity through API"""
         try:
             # Test by creating a simple status check (legacy endpoint)
@@ -504,14 +613,14 @@ class BackendTester:
                 "timestamp": datetime.now().isoformat()
             }
             
-            response = requests.post(f"{self.api_url}/status", json=payload, timeout=10)
+            response = await self._request("POST", f"{self.api_url}/status", json=payload, timeout=10)
             
-            if response.status_code == 200:
+            if response.status == 200:
                 # Now try to retrieve it
-                get_response = requests.get(f"{self.api_url}/status", timeout=10)
+                get_response = await self._request("GET", f"{self.api_url}/status", timeout=10)
                 
-                if get_response.status_code == 200:
-                    status_checks = get_response.json()
+                if get_response.status == 200:
+                    status_checks = await _json(get_response)
                     if isinstance(status_checks, list):
                         self.log_test("Database Connectivity", True, 
                                     f"Database operations working, {len(status_checks)} status checks found")
@@ -520,15 +629,15 @@ class BackendTester:
                                     error="Invalid status checks format")
                 else:
                     self.log_test("Database Connectivity", False, 
-                                error=f"Failed to retrieve status: HTTP {get_response.status_code}")
+                                error=f"Failed to retrieve status: HTTP {get_response.status}")
             else:
                 self.log_test("Database Connectivity", False, 
-                            error=f"Failed to create status: HTTP {response.status_code}")
+                            error=f"Failed to create status: HTTP {response.status}")
                 
         except Exception as e:
             self.log_test("Database Connectivity", False, error=str(e))
 
-    def test_api_keys_configuration(self):
+    async def test_api_keys_configuration(self):
         """Test API keys are properly configured"""
         try:
             # Check backend .env file
@@ -559,37 +668,35 @@ class BackendTester:
         except Exception as e:
             self.log_test("API Keys Configuration", False, error=str(e))
 
-    def test_dual_code_editor_backend_support(self):
+    async def test_dual_code_editor_backend_support(self):
         """Test backend endpoints specifically needed for Dual Code Editor functionality"""
-        print("🎨 TESTING DUAL CODE EDITOR BACKEND SUPPORT")
-        print("-" * 60)
+        self._print("🎨 TESTING DUAL CODE EDITOR BACKEND SUPPORT")
+        self._print("-" * 60)
         
         # Test 1: Projects List for Editor Selector
-        projects = self.test_projects_list_for_editor()
+        projects = await self.test_projects_list_for_editor()
         
-        # Test 2: Load Specific Project for Editing
+        # Tests 2, 4 and 5 only read the project or create a new one, so they run together:
+        # Load Specific Project for Editing, Create New Project from Editor,
+        # Verify Project File Structure Compatibility
+        independent = [self.test_create_project_from_editor()]
         if projects:
-            self.test_load_project_for_editing(projects[0])
+            independent += [
+                self.test_load_project_for_editing(projects[0]),
+                self.test_project_file_structure_compatibility(projects[0])
+            ]
+        await asyncio.gather(*independent)
         
-        # Test 3: Update Project (Save Changes)
+        # Test 3: Update Project (Save Changes) writes then reads back, so it runs last
         if projects:
-            self.test_update_project_for_editor(projects[0])
-        
-        # Test 4: Create New Project from Editor
-        self.test_create_project_from_editor()
-        
-        # Test 5: Verify Project File Structure Compatibility
-        if projects:
-            self.test_project_file_structure_compatibility(projects[0])
+            await self.test_update_project_for_editor(projects[0])
 
-    def test_projects_list_for_editor(self):
+    async def test_projects_list_for_editor(self):
         """Test GET /api/projects specifically for editor project selector"""
         try:
-            response = requests.get(f"{self.api_url}/projects", timeout=10)
+            status, data = await self._get_projects()
             
-            if response.status_code == 200:
-                data = response.json()
-                
+            if status == 200:
                 if "projects" in data and "total" in data:
                     projects = data.get("projects", [])
                     total_projects = data.get("total", 0)
@@ -616,24 +723,22 @@ class BackendTester:
                                 error="Response missing 'projects' or 'total' fields")
             else:
                 self.log_test("Projects List for Editor Selector", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
+                            error=f"HTTP {status}: {data}")
                 
         except Exception as e:
             self.log_test("Projects List for Editor Selector", False, error=str(e))
         
         return []
 
-    def test_load_project_for_editing(self, project):
+    async def test_load_project_for_editing(self, project):
         """Test GET /api/projects/{id} for loading project in editor"""
         try:
             project_id = project.get("id")
             project_name = project.get("name", "Unknown")
             
-            response = requests.get(f"{self.api_url}/projects/{project_id}", timeout=10)
+            status, data = await self._get_project(project_id)
             
-            if response.status_code == 200:
-                data = response.json()
-                
+            if status == 200:
                 # Check if project has files structure needed by editor
                 if "files" in data:
                     files = data.get("files", [])
@@ -641,21 +746,7 @@ class BackendTester:
                     # Check if files is in correct format (list or dict)
                     if isinstance(files, (list, dict)):
                         # Look for HTML content that editor can load
-                        html_content_found = False
-                        
-                        if isinstance(files, list):
-                            for file in files:
-                                if isinstance(file, dict) and file.get("filename", "").lower().endswith('.html'):
-                                    if file.get("content"):
-                                        html_content_found = True
-                                        break
-                        elif isinstance(files, dict):
-                            for filename, content in files.items():
-                                if filename.lower().endswith('.html') and content:
-                                    html_content_found = True
-                                    break
-                        
-                        if html_content_found:
+                        if "html" in _file_exts(files):
                             details = f"✅ Project '{project_name}' loaded with HTML content for editor"
                             self.log_test("Load Project for Editing", True, details)
                             return data
@@ -670,49 +761,31 @@ class BackendTester:
                 else:
                     self.log_test("Load Project for Editing", False, 
                                 error="Project missing 'files' field")
-            elif response.status_code == 404:
+            elif status == 404:
                 self.log_test("Load Project for Editing", False, 
                             error="Project not found (404)")
             else:
                 self.log_test("Load Project for Editing", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
+                            error=f"HTTP {status}: {data}")
                 
         except Exception as e:
             self.log_test("Load Project for Editing", False, error=str(e))
         
         return None
 
-    def test_update_project_for_editor(self, project):
+    async def test_update_project_for_editor(self, project):
         """Test PUT /api/projects/{id} for saving changes from editor"""
         try:
             project_id = project.get("id")
             project_name = project.get("name", "Unknown")
             
             # Create test HTML content that editor would save
-            test_html_content = """<!DOCTYPE html>
-<html lang="es">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Test Editor Update</title>
-    <style>
-        body { font-family: Arial, sans-serif; background: #f0f0f0; padding: 2rem; }
-        .container { background: white; padding: 2rem; border-radius: 10px; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🎨 Editor Test Update</h1>
-        <p>This content was updated via the Dual Code Editor backend test.</p>
-        <p>Timestamp: """ + datetime.now().isoformat() + """</p>
-    </div>
-</body>
-</html>"""
+            test_html_content = _EDITOR_TEST_HTML_TEMPLATE.format(timestamp=datetime.now().isoformat())
             
             # Prepare update data in format expected by editor
             update_data = {
+                **_BASE_UPDATE_DATA,
                 "name": project_name,
-                "description": project.get("description", "Updated via editor test"),
                 "files": [
                     {
                         "filename": "index.html",
@@ -720,30 +793,27 @@ class BackendTester:
                     }
                 ]
             }
+            if "description" in project:
+                update_data["description"] = project["description"]
             
-            response = requests.put(f"{self.api_url}/projects/{project_id}", 
-                                  json=update_data, timeout=15)
+            response = await self._request("PUT", f"{self.api_url}/projects/{project_id}", 
+                                           json=update_data, timeout=15)
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = await _json(response)
+                
+                # The stored project changed, drop whatever was read before the write
+                self._project_cache.pop(project_id, None)
                 
                 if data.get("success"):
                     # Verify the update by fetching the project again
-                    verify_response = requests.get(f"{self.api_url}/projects/{project_id}", timeout=10)
+                    verify_status, verify_data = await self._get_project(project_id, force=True)
                     
-                    if verify_response.status_code == 200:
-                        verify_data = verify_response.json()
+                    if verify_status == 200:
                         files = verify_data.get("files", [])
                         
                         # Check if our HTML content was saved
-                        html_updated = False
-                        if isinstance(files, list):
-                            for file in files:
-                                if (isinstance(file, dict) and 
-                                    file.get("filename") == "index.html" and 
-                                    "Editor Test Update" in file.get("content", "")):
-                                    html_updated = True
-                                    break
+                        html_updated = "Editor Test Update" in (_index_files(files).get("index.html") or "")
                         
                         if html_updated:
                             details = f"✅ Project '{project_name}' updated successfully with editor content"
@@ -758,17 +828,17 @@ class BackendTester:
                 else:
                     self.log_test("Update Project for Editor", False, 
                                 error=f"Update failed: {data.get('message', 'Unknown error')}")
-            elif response.status_code == 404:
+            elif response.status == 404:
                 self.log_test("Update Project for Editor", False, 
                             error="Project not found (404)")
             else:
                 self.log_test("Update Project for Editor", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
+                            error=f"HTTP {response.status}: {await response.text()}")
                 
         except Exception as e:
             self.log_test("Update Project for Editor", False, error=str(e))
 
-    def test_create_project_from_editor(self):
+    async def test_create_project_from_editor(self):
         """Test POST /api/generate-website for creating new projects from editor"""
         try:
             # Create test project data as editor would send
@@ -780,11 +850,10 @@ class BackendTester:
                 "description": "Proyecto creado desde el editor de código para testing"
             }
             
-            response = requests.post(f"{self.api_url}/generate-website", 
-                                   json=test_project_data, timeout=60)
+            response = await self._post_generate(test_project_data, timeout=60)
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = await _json(response)
                 
                 if data.get("success"):
                     project_id = data.get("project_id")
@@ -793,9 +862,9 @@ class BackendTester:
                     # Check if project was created with proper structure
                     if project_id and files:
                         # Verify project exists in database
-                        verify_response = requests.get(f"{self.api_url}/projects/{project_id}", timeout=10)
+                        verify_status, _ = await self._get_project(project_id, force=True)
                         
-                        if verify_response.status_code == 200:
+                        if verify_status == 200:
                             details = f"✅ New project created from editor with ID: {project_id[:8]}..."
                             self.log_test("Create Project from Editor", True, details)
                             return data
@@ -811,23 +880,22 @@ class BackendTester:
                                 error=f"Project creation failed: {error_msg}")
             else:
                 self.log_test("Create Project from Editor", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
+                            error=f"HTTP {response.status}: {await response.text()}")
                 
         except Exception as e:
             self.log_test("Create Project from Editor", False, error=str(e))
         
         return None
 
-    def test_project_file_structure_compatibility(self, project):
+    async def test_project_file_structure_compatibility(self, project):
         """Test that project file structure is compatible with editor expectations"""
         try:
             project_id = project.get("id")
             project_name = project.get("name", "Unknown")
             
-            response = requests.get(f"{self.api_url}/projects/{project_id}", timeout=10)
+            status, data = await self._get_project(project_id)
             
-            if response.status_code == 200:
-                data = response.json()
+            if status == 200:
                 files = data.get("files", [])
                 
                 compatibility_issues = []
@@ -837,20 +905,7 @@ class BackendTester:
                     compatibility_issues.append(f"Files format is {type(files)}, expected list or dict")
                 
                 # Check for HTML content accessibility
-                html_accessible = False
-                if isinstance(files, list):
-                    for file in files:
-                        if isinstance(file, dict):
-                            filename = file.get("filename", "")
-                            content = file.get("content", "")
-                            if filename.lower().endswith('.html') and content:
-                                html_accessible = True
-                                break
-                elif isinstance(files, dict):
-                    for filename, content in files.items():
-                        if filename.lower().endswith('.html') and content:
-                            html_accessible = True
-                            break
+                html_accessible = "html" in _file_exts(files)
                 
                 # Check project metadata
                 required_metadata = ['id']
@@ -867,100 +922,101 @@ class BackendTester:
                                 error=f"Compatibility issues: {'; '.join(compatibility_issues)}")
             else:
                 self.log_test("Project File Structure Compatibility", False, 
-                            error=f"Could not fetch project: HTTP {response.status_code}")
+                            error=f"Could not fetch project: HTTP {status}")
                 
         except Exception as e:
             self.log_test("Project File Structure Compatibility", False, error=str(e))
 
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all backend tests"""
-        print("🚀 Starting Comprehensive Backend Testing")
-        print("=" * 60)
-        
-        # Test 1: API Root
-        self.test_api_root()
-        
-        # Test 2: API Keys Configuration
-        self.test_api_keys_configuration()
-        
-        # Test 3: AI Providers Configuration
-        self.test_ai_providers_endpoint()
-        
-        # Test 4: Website Types
-        self.test_website_types_endpoint()
+        self._print("🚀 Starting Comprehensive Backend Testing")
+        self._print("=" * 60)
         
-        # Test 5: Database Connectivity
-        self.test_database_connectivity()
-        
-        # Test 6: OpenAI Website Generation
-        openai_result = self.test_website_generation_openai()
-        
-        # Test 7: Gemini Website Generation  
-        gemini_result = self.test_website_generation_gemini()
-        
-        # Test 8: Provider Comparison
-        comparison_result = self.test_provider_comparison()
-        
-        # Test 9: Projects List
-        projects = self.test_projects_list()
-        
-        # Test 10: Project Retrieval
-        self.test_project_retrieval(projects)
-        
-        # Test 11: PROJECT DELETION FUNCTIONALITY (FOCUS TEST)
-        self.test_project_deletion_functionality()
-        
-        # Test 12: DUAL CODE EDITOR BACKEND SUPPORT (FOCUS TEST)
-        self.test_dual_code_editor_backend_support()
+        # One session for the whole run so every test shares the keep-alive pool
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=10, keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            self.session = session
+            
+            # Tests 1-5: API root, API keys, AI providers, website types and
+            # database connectivity are independent of each other
+            await asyncio.gather(
+                self.test_api_root(),
+                self.test_api_keys_configuration(),
+                self.test_ai_providers_endpoint(),
+                self.test_website_types_endpoint(),
+                self.test_database_connectivity()
+            )
+            
+            # Test 6: Website Generation (OpenAI/Gemini × every website type)
+            generation_results = await self.test_website_generation_matrix()
+            
+            # Test 7: Provider Comparison
+            comparison_result = await self.test_provider_comparison()
+            
+            # Test 8: Projects List
+            projects = await self.test_projects_list()
+            
+            # Test 9: Project Retrieval
+            await self.test_project_retrieval(projects)
+            
+            # Test 10: PROJECT DELETION FUNCTIONALITY (FOCUS TEST)
+            await self.test_project_deletion_functionality()
+            
+            # Test 11: DUAL CODE EDITOR BACKEND SUPPORT (FOCUS TEST)
+            await self.test_dual_code_editor_backend_support()
         
         # Generate Summary
         self.generate_summary()
 
     def generate_summary(self):
         """Generate test summary"""
-        print("=" * 60)
-        print("📊 TEST SUMMARY")
-        print("=" * 60)
+        self._print("=" * 60)
+        self._print("📊 TEST SUMMARY")
+        self._print("=" * 60)
         
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for r in self.test_results if r["success"])
+        passed_tests = sum(1 for _, ok, _, _, _ in self.test_results if ok)
         failed_tests = total_tests - passed_tests
         
-        print(f"Total Tests: {total_tests}")
-        print(f"✅ Passed: {passed_tests}")
-        print(f"❌ Failed: {failed_tests}")
-        print(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%")
-        print()
+        self._print(f"Total Tests: {total_tests}")
+        self._print(f"✅ Passed: {passed_tests}")
+        self._print(f"❌ Failed: {failed_tests}")
+        self._print(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%")
+        self._print()
         
         if failed_tests > 0:
-            print("❌ FAILED TESTS:")
-            for result in self.test_results:
-                if not result["success"]:
-                    print(f"   • {result['test']}: {result['error']}")
-            print()
+            self._print("❌ FAILED TESTS:")
+            for name, ok, _, err, _ in self.test_results:
+                if not ok:
+                    self._print(f"   • {name}: {err}")
+            self._print()
         
-        print("✅ PASSED TESTS:")
-        for result in self.test_results:
-            if result["success"]:
-                print(f"   • {result['test']}")
+        self._print("✅ PASSED TESTS:")
+        for name, ok, _, _, _ in self.test_results:
+            if ok:
+                self._print(f"   • {name}")
         
-        print("\n" + "=" * 60)
+        self._print("\n" + "=" * 60)
         
         # Save detailed results
-        with open('/app/backend_test_results.json', 'w') as f:
-            json.dump({
+        with open('/app/backend_test_results.json', 'wb') as f:
+            f.write(orjson.dumps({
                 "summary": {
                     "total": total_tests,
                     "passed": passed_tests,
                     "failed": failed_tests,
                     "success_rate": (passed_tests/total_tests)*100
                 },
-                "results": self.test_results,
+                "results": [
+                    {"test": name, "success": ok, "details": details, "error": err, "timestamp": self._wall_iso(ts_ns)}
+                    for name, ok, details, err, ts_ns in self.test_results
+                ],
                 "timestamp": datetime.now().isoformat()
-            }, f, indent=2)
+            }, option=orjson.OPT_INDENT_2))
         
-        print("📄 Detailed results saved to: /app/backend_test_results.json")
+        self._print("📄 Detailed results saved to: /app/backend_test_results.json")
+        self._flush_output()
 
 if __name__ == "__main__":
     tester = BackendTester()
-    tester.run_all_tests()
\ No newline at end of file
+    asyncio.run(tester.run_all_tests())
\ No newline at end of file
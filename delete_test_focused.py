@@ -5,22 +5,44 @@ Tests the recently fixed delete project feature
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
 import time
 from datetime import datetime
 
+from test_support.env import load_backend_url
+
+# Short connect timeout so a down backend fails fast; reads keep their own budget
+CONNECT_TIMEOUT = 2.0
+
+def _now_iso():
+    """Local ISO-8601 timestamp with microseconds, without building a datetime"""
+    now = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now)) + f".{int(now % 1 * 1_000_000):06d}"
+
+def _json(response):
+    """Decode a JSON response body with orjson straight from the raw bytes"""
+    return orjson.loads(response.content)
+
+def _json_post(session, url, payload, **kwargs):
+    """POST a JSON body encoded with orjson instead of requests' stdlib json"""
+    return session.post(url, data=orjson.dumps(payload), 
+                        headers={"Content-Type": "application/json"}, **kwargs)
+
 class DeleteFunctionalityTester:
     def __init__(self):
         # Get backend URL from frontend env
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_BACKEND_URL='):
-                    self.base_url = line.split('=')[1].strip()
-                    break
+        self.base_url = load_backend_url()
         
         self.api_url = f"{self.base_url}/api"
         self.test_results = []
         
+        # One pooled keep-alive session for every request in the suite
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
         print(f"🗑️  FOCUSED DELETE FUNCTIONALITY TEST")
         print(f"🔧 Testing Backend API at: {self.api_url}")
         print("=" * 60)
@@ -28,13 +50,8 @@ class DeleteFunctionalityTester:
     def log_result(self, test_name: str, success: bool, details: str = "", error: str = ""):
         """Log test results"""
         status = "✅ PASS" if success else "❌ FAIL"
-        self.test_results.append({
-            "test": test_name,
-            "success": success,
-            "details": details,
-            "error": error,
-            "timestamp": datetime.now().isoformat()
-        })
+        # Rows stay plain tuples; dicts are only built for the JSON report
+        self.test_results.append((test_name, success, details, error, _now_iso()))
         
         print(f"{status} {test_name}")
         if details:
@@ -46,9 +63,9 @@ class DeleteFunctionalityTester:
     def get_projects_list(self):
         """Get current projects list"""
         try:
-            response = requests.get(f"{self.api_url}/projects", timeout=30)
+            response = self.session.get(f"{self.api_url}/projects", timeout=(CONNECT_TIMEOUT, 30))
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 return data.get("projects", []), data.get("total", 0)
         except Exception as e:
             print(f"Error getting projects: {e}")
@@ -64,11 +81,11 @@ class DeleteFunctionalityTester:
             }
             
             print("🔄 Creating test project for deletion...")
-            response = requests.post(f"{self.api_url}/generate-website", 
-                                   json=payload, timeout=120)
+            response = _json_post(self.session, f"{self.api_url}/generate-website", payload, 
+                                  timeout=(CONNECT_TIMEOUT, 120))
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 if data.get("success"):
                     project_id = data.get("project_id")
                     print(f"✅ Test project created with ID: {project_id}")
@@ -82,6 +99,32 @@ class DeleteFunctionalityTester:
         
         return None
 
+    def _create_stub_project(self):
+        """Seed a minimal project through the backend test route, skipping the LLM"""
+        try:
+            payload = {
+                "name": "TestCorp Stub Project",
+                "files": {"index.html": "<html><body>Deletion test</body></html>"}
+            }
+            response = _json_post(self.session, f"{self.api_url}/projects/_test_seed", payload, 
+                                  timeout=(CONNECT_TIMEOUT, 10))
+            
+            # 404 means the backend runs without test routes enabled
+            if response.status_code == 200:
+                data = _json(response)
+                if data.get("success"):
+                    project_id = data.get("project_id")
+                    print(f"✅ Stub project seeded with ID: {project_id}")
+                    return {
+                        "id": project_id,
+                        "name": payload["name"],
+                        "provider": "test"
+                    }
+        except Exception as e:
+            print(f"❌ Error seeding stub project: {e}")
+        
+        return None
+
     def test_1_delete_endpoint_functionality(self):
         """Test 1: DELETE /api/projects/{project_id} endpoint"""
         print("🧪 TEST 1: DELETE Endpoint Functionality")
@@ -91,8 +134,8 @@ class DeleteFunctionalityTester:
         projects, total = self.get_projects_list()
         
         if not projects:
-            # Create a test project
-            test_project = self.create_test_project()
+            # Seed a stub project, generating one only if the seed route is unavailable
+            test_project = self._create_stub_project() or self.create_test_project()
             if not test_project:
                 self.log_result("DELETE Endpoint - Setup", False, 
                               error="Could not create test project")
@@ -106,10 +149,10 @@ class DeleteFunctionalityTester:
         try:
             print(f"🗑️  Attempting to delete project: {project_name} (ID: {project_id})")
             
-            response = requests.delete(f"{self.api_url}/projects/{project_id}", timeout=30)
+            response = self.session.delete(f"{self.api_url}/projects/{project_id}", timeout=(CONNECT_TIMEOUT, 30))
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 
                 if data.get("success") and "deleted successfully" in data.get("message", ""):
                     self.log_result("DELETE /api/projects/{id}", True, 
@@ -133,11 +176,15 @@ class DeleteFunctionalityTester:
         print("-" * 40)
         
         try:
-            # Wait a moment for database to update
-            time.sleep(2)
-            
-            # Get updated projects list
-            current_projects, current_total = self.get_projects_list()
+            # Poll until the deleted project drops out of the list (2s cap)
+            deadline = time.monotonic() + 2.0
+            while True:
+                current_projects, current_total = self.get_projects_list()
+                if deleted_project_id not in [p.get("id") for p in current_projects]:
+                    break
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(0.05)
             
             # Check if count decreased
             if current_total == initial_count - 1:
@@ -165,10 +212,10 @@ class DeleteFunctionalityTester:
         try:
             fake_project_id = "nonexistent-project-12345-test"
             
-            response = requests.delete(f"{self.api_url}/projects/{fake_project_id}", timeout=30)
+            response = self.session.delete(f"{self.api_url}/projects/{fake_project_id}", timeout=(CONNECT_TIMEOUT, 30))
             
             if response.status_code == 404:
-                data = response.json()
+                data = _json(response)
                 if "not found" in data.get("detail", "").lower():
                     self.log_result("404 Error Handling", True, 
                                   "Correctly returned 404 for non-existent project")
@@ -188,10 +235,10 @@ class DeleteFunctionalityTester:
         print("-" * 40)
         
         try:
-            response = requests.get(f"{self.api_url}/projects", timeout=30)
+            response = self.session.get(f"{self.api_url}/projects", timeout=(CONNECT_TIMEOUT, 30))
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 
                 if "projects" in data and "total" in data:
                     total_projects = data.get("total", 0)
@@ -234,6 +281,8 @@ class DeleteFunctionalityTester:
         
         # Generate summary
         self.generate_summary()
+        
+        self.session.close()
 
     def generate_summary(self):
         """Generate test summary"""
@@ -242,7 +291,7 @@ class DeleteFunctionalityTester:
         print("=" * 60)
         
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for r in self.test_results if r["success"])
+        passed_tests = sum(1 for _, ok, _, _, _ in self.test_results if ok)
         failed_tests = total_tests - passed_tests
         
         print(f"Total Tests: {total_tests}")
@@ -253,30 +302,33 @@ class DeleteFunctionalityTester:
         
         if failed_tests > 0:
             print("❌ FAILED TESTS:")
-            for result in self.test_results:
-                if not result["success"]:
-                    print(f"   • {result['test']}: {result['error']}")
+            for name, ok, _, err, _ in self.test_results:
+                if not ok:
+                    print(f"   • {name}: {err}")
             print()
         
         print("✅ PASSED TESTS:")
-        for result in self.test_results:
-            if result["success"]:
-                print(f"   • {result['test']}")
+        for name, ok, _, _, _ in self.test_results:
+            if ok:
+                print(f"   • {name}")
         
         print("\n" + "=" * 60)
         
         # Save results
-        with open('/app/delete_test_results.json', 'w') as f:
-            json.dump({
+        with open('/app/delete_test_results.json', 'wb') as f:
+            f.write(orjson.dumps({
                 "summary": {
                     "total": total_tests,
                     "passed": passed_tests,
                     "failed": failed_tests,
                     "success_rate": (passed_tests/total_tests)*100
                 },
-                "results": self.test_results,
+                "results": [
+                    {"test": name, "success": ok, "details": details, "error": err, "timestamp": ts}
+                    for name, ok, details, err, ts in self.test_results
+                ],
                 "timestamp": datetime.now().isoformat()
-            }, f, indent=2)
+            }, option=orjson.OPT_INDENT_2))
         
         print("📄 Results saved to: /app/delete_test_results.json")
 
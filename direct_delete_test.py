@@ -7,7 +7,10 @@ Tests the delete functionality by directly accessing the database and API
 import sys
 import os
 import asyncio
-import json
+import orjson
+import re
+import time
+import uuid
 from datetime import datetime
 
 # Add backend to path
@@ -15,23 +18,44 @@ sys.path.append('/app/backend')
 
 from database import DatabaseService
 from motor.motor_asyncio import AsyncIOMotorClient
+from test_support.tasks import run_bounded
+
+# Markers of a complete DELETE endpoint in server.py, matched in a single scan
+_DELETE_ROUTE = '@api_router.delete("/projects/{project_id}")'
+_DELETE_FUNCTION = 'async def delete_project(project_id: str'
+_DELETE_DB_CALL = 'await db_service.delete_project(project_id)'
+_ENDPOINT_RE = re.compile("|".join(map(re.escape, (_DELETE_ROUTE, _DELETE_FUNCTION, _DELETE_DB_CALL))))
+
+# Every test owns a fixed slot in test_results, so concurrent tests never
+# grow the list and the saved report keeps this order
+_TEST_ORDER = (
+    "Database Connection",
+    "Delete Project Function",
+    "Delete Non-existent Project",
+    "API Endpoint Structure"
+)
+_TEST_SLOTS = {name: i for i, name in enumerate(_TEST_ORDER)}
 
 class DirectDeleteTester:
     def __init__(self):
-        self.test_results = []
+        self.test_results = [None] * len(_TEST_ORDER)
+        
+        # One connected DatabaseService shared by every test, opened on first use
+        self.db_service = None
+        
         print("🗑️  DIRECT DELETE FUNCTIONALITY TEST")
         print("=" * 60)
 
     def log_result(self, test_name: str, success: bool, details: str = "", error: str = ""):
         """Log test results"""
         status = "✅ PASS" if success else "❌ FAIL"
-        self.test_results.append({
+        self.test_results[_TEST_SLOTS[test_name]] = {
             "test": test_name,
             "success": success,
             "details": details,
             "error": error,
-            "timestamp": datetime.now().isoformat()
-        })
+            "ts": time.time()  # formatted when the results are saved
+        }
         
         print(f"{status} {test_name}")
         if details:
@@ -40,19 +64,24 @@ class DirectDeleteTester:
             print(f"   ⚠️  {error}")
         print()
 
+    async def _get_db(self) -> DatabaseService:
+        """Return the shared database service, connecting it on first use"""
+        if self.db_service is None:
+            db_service = DatabaseService()
+            await db_service.connect()
+            self.db_service = db_service
+        return self.db_service
+
     async def test_database_connection(self):
         """Test database connection"""
         try:
-            db_service = DatabaseService()
-            await db_service.connect()
+            db_service = await self._get_db()
             
-            # Test basic database operation
-            projects = await db_service.list_projects(1, 10)
+            # A ping is a single no-op round-trip, enough to prove the connection works
+            await db_service.client.admin.command('ping')
             
-            self.log_result("Database Connection", True, 
-                          f"Connected successfully, found {projects.get('total', 0)} projects")
+            self.log_result("Database Connection", True, "Connected successfully, ping OK")
             
-            await db_service.close()
             return True
             
         except Exception as e:
@@ -62,8 +91,7 @@ class DirectDeleteTester:
     async def test_delete_project_function(self):
         """Test the delete_project function directly"""
         try:
-            db_service = DatabaseService()
-            await db_service.connect()
+            db_service = await self._get_db()
             
             # First, get existing projects
             projects_data = await db_service.list_projects(1, 10)
@@ -73,9 +101,11 @@ class DirectDeleteTester:
             print(f"📊 Found {initial_count} projects in database")
             
             if initial_count == 0:
-                # Create a test project first
+                # Create a test project first, choosing its id up front
+                test_project_id = str(uuid.uuid4())
                 test_project_data = {
                     "success": True,
+                    "session_id": test_project_id,
                     "files": {
                         "index.html": "<html><body><h1>Test Project for Deletion</h1></body></html>",
                         "styles.css": "body { font-family: Arial; }"
@@ -87,13 +117,12 @@ class DirectDeleteTester:
                     }
                 }
                 
-                project_id = await db_service.save_project(test_project_data)
-                print(f"✅ Created test project with ID: {project_id}")
+                await db_service.save_project(test_project_data)
+                print(f"✅ Created test project with ID: {test_project_id}")
                 
-                # Refresh projects list
-                projects_data = await db_service.list_projects(1, 10)
-                initial_count = projects_data.get('total', 0)
-                projects = projects_data.get('projects', [])
+                # The new project is the only one, no need to list again
+                initial_count = 1
+                projects = [{"id": test_project_id}]
             
             if projects:
                 # Test deletion
@@ -130,16 +159,13 @@ class DirectDeleteTester:
                 self.log_result("Delete Project Function", False, 
                               error="No projects available for testing")
             
-            await db_service.close()
-            
         except Exception as e:
             self.log_result("Delete Project Function", False, error=str(e))
 
     async def test_delete_nonexistent_project(self):
         """Test deletion of non-existent project"""
         try:
-            db_service = DatabaseService()
-            await db_service.connect()
+            db_service = await self._get_db()
             
             fake_project_id = "nonexistent-project-12345"
             
@@ -152,22 +178,24 @@ class DirectDeleteTester:
                 self.log_result("Delete Non-existent Project", False, 
                               error="Should return False for non-existent project")
             
-            await db_service.close()
-            
         except Exception as e:
             self.log_result("Delete Non-existent Project", False, error=str(e))
 
     async def test_api_endpoint_structure(self):
         """Test that the API endpoint exists in server.py"""
         try:
-            # Read server.py to check if DELETE endpoint exists
+            # Stream server.py, stopping as soon as every DELETE endpoint marker has been seen
+            hits = set()
             with open('/app/backend/server.py', 'r') as f:
-                server_content = f.read()
+                for line in f:
+                    hits.update(_ENDPOINT_RE.findall(line))
+                    if len(hits) == 3:
+                        break
             
             # Check for DELETE endpoint
-            has_delete_endpoint = '@api_router.delete("/projects/{project_id}")' in server_content
-            has_delete_function = 'async def delete_project(project_id: str):' in server_content
-            has_db_call = 'await db_service.delete_project(project_id)' in server_content
+            has_delete_endpoint = _DELETE_ROUTE in hits
+            has_delete_function = _DELETE_FUNCTION in hits
+            has_db_call = _DELETE_DB_CALL in hits
             
             if has_delete_endpoint and has_delete_function and has_db_call:
                 self.log_result("API Endpoint Structure", True, 
@@ -199,14 +227,21 @@ class DirectDeleteTester:
             # Test 2: Delete project function
             await self.test_delete_project_function()
             
-            # Test 3: Delete non-existent project
-            await self.test_delete_nonexistent_project()
-        
-        # Test 4: API endpoint structure
-        await self.test_api_endpoint_structure()
+            # Test 3: Delete non-existent project, overlapped with
+            # Test 4: API endpoint structure (reads server.py while the delete is in flight)
+            await run_bounded(
+                self.test_delete_nonexistent_project(),
+                self.test_api_endpoint_structure()
+            )
+        else:
+            # Test 4: API endpoint structure
+            await self.test_api_endpoint_structure()
         
         # Generate summary
         self.generate_summary()
+        
+        if self.db_service:
+            await self.db_service.close()
 
     def generate_summary(self):
         """Generate test summary"""
@@ -214,9 +249,16 @@ class DirectDeleteTester:
         print("📊 DIRECT DELETE TEST SUMMARY")
         print("=" * 60)
         
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for r in self.test_results if r["success"])
-        failed_tests = total_tests - passed_tests
+        # One pass over the slots; tests skipped because the database was
+        # unreachable leave their slot empty
+        results, passed, failed = [], [], []
+        for r in self.test_results:
+            if r is not None:
+                results.append(r)
+                (passed if r["success"] else failed).append(r)
+        total_tests = len(results)
+        passed_tests = len(passed)
+        failed_tests = len(failed)
         
         print(f"Total Tests: {total_tests}")
         print(f"✅ Passed: {passed_tests}")
@@ -226,30 +268,31 @@ class DirectDeleteTester:
         
         if failed_tests > 0:
             print("❌ FAILED TESTS:")
-            for result in self.test_results:
-                if not result["success"]:
-                    print(f"   • {result['test']}: {result['error']}")
+            for result in failed:
+                print(f"   • {result['test']}: {result['error']}")
             print()
         
         print("✅ PASSED TESTS:")
-        for result in self.test_results:
-            if result["success"]:
-                print(f"   • {result['test']}")
+        for result in passed:
+            print(f"   • {result['test']}")
         
         print("\n" + "=" * 60)
         
         # Save results
-        with open('/app/direct_delete_test_results.json', 'w') as f:
-            json.dump({
+        with open('/app/direct_delete_test_results.json', 'wb') as f:
+            f.write(orjson.dumps({
                 "summary": {
                     "total": total_tests,
                     "passed": passed_tests,
                     "failed": failed_tests,
                     "success_rate": (passed_tests/total_tests)*100
                 },
-                "results": self.test_results,
+                "results": [
+                    {**{k: v for k, v in r.items() if k != "ts"}, "timestamp": datetime.fromtimestamp(r["ts"]).isoformat()}
+                    for r in results
+                ],
                 "timestamp": datetime.now().isoformat()
-            }, f, indent=2)
+            }, option=orjson.OPT_INDENT_2))
         
         print("📄 Results saved to: /app/direct_delete_test_results.json")
 
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Locust Load Test for the AI Enhancement Endpoint
+Drives the request shapes of test_enhancement_direct.py concurrently to measure throughput and error rate:
+    locust -f locustfile.py --headless -u 24 -r 4 -t 10m
+"""
+
+import random
+import uuid
+
+from locust import HttpUser, between, task
+
+from test_enhancement_direct import (
+    ENHANCEMENT_CASES,
+    PRIORITY_ENHANCEMENT,
+    _APPLY_READ_TIMEOUT,
+    _BASE_URL
+)
+from test_support.enhance import SAMPLE_HTML
+
+class EnhanceUser(HttpUser):
+    wait_time = between(0.1, 0.5)
+    host = _BASE_URL
+
+    def _enhance(self, name: str, fields: dict, timeout: float):
+        """POST an enhancement for the sample page, failing the sample unless the backend reports success"""
+        payload = {
+            "project_id": str(uuid.uuid4()),
+            "current_content": SAMPLE_HTML,
+            **fields
+        }
+        
+        with self.client.post("/api/enhance-project", json=payload, timeout=timeout, 
+                              name=name, catch_response=True) as response:
+            if response.status_code != 200:
+                response.failure(f"HTTP {response.status_code}")
+            elif not response.json().get("success"):
+                response.failure(response.json().get("error", "Unknown error"))
+
+    @task(1)
+    def ai_providers(self):
+        """AI Service Integration probe"""
+        self.client.get("/api/ai-providers", timeout=10, name="ai-providers")
+
+    @task(3)
+    def suggestions(self):
+        """Enhancement Suggestions Mode (apply=false)"""
+        self._enhance("enhance:suggestions", {"enhancement_type": "suggestions", "apply": False}, timeout=30)
+
+    @task(1)
+    def priority_logic(self):
+        """apply=true with enhancement_type=suggestions"""
+        self._enhance("enhance:priority", {
+            "enhancement": PRIORITY_ENHANCEMENT,
+            "enhancement_type": "suggestions",
+            "apply": True
+        }, timeout=_APPLY_READ_TIMEOUT)
+
+    @task(2)
+    def apply_mode(self):
+        """One of the apply=true cases, reported per label"""
+        label, enhancement, mod_type, _ = random.choice(ENHANCEMENT_CASES)
+        self._enhance(f"enhance:apply-{label}", {
+            "enhancement": enhancement,
+            "apply": True,
+            "modification_type": mod_type
+        }, timeout=_APPLY_READ_TIMEOUT)
@@ -4,18 +4,19 @@ Quick Backend Testing for Professional Website Generator
 Tests core API endpoints without time-consuming AI generation
 """
 
-import requests
+import aiohttp
 import json
 from datetime import datetime
+from operator import itemgetter
+
+from test_support.env import load_backend_url
+from test_support.http import get_session, run
+from test_support.tasks import run_bounded
 
 class QuickBackendTester:
     def __init__(self):
         # Get backend URL from frontend env
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_BACKEND_URL='):
-                    self.base_url = line.split('=')[1].strip()
-                    break
+        self.base_url = load_backend_url()
         
         self.api_url = f"{self.base_url}/api"
         self.results = []
@@ -23,36 +24,35 @@ class QuickBackendTester:
         print(f"🔧 Quick Testing Backend API at: {self.api_url}")
         print("=" * 60)
 
-    def test_endpoint(self, name, endpoint, method="GET", payload=None, timeout=10):
+    async def test_endpoint(self, session, name, endpoint, method="GET", payload=None, timeout=10):
         """Test a single endpoint"""
         try:
-            if method == "GET":
-                response = requests.get(f"{self.api_url}{endpoint}", timeout=timeout)
-            elif method == "POST":
-                response = requests.post(f"{self.api_url}{endpoint}", json=payload, timeout=timeout)
+            async with session.request(method, f"{self.api_url}{endpoint}", json=payload, 
+                                       timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                status = response.status
+                # HEAD probes only check the endpoint exists, there is no body to read
+                body = "" if method == "HEAD" else await response.text()
             
-            success = response.status_code == 200
+            success = status == 200
             
             if success:
-                data = response.json()
+                data = json.loads(body) if body else None
                 print(f"✅ {name}: OK")
                 if isinstance(data, dict):
                     if "message" in data:
                         print(f"   📝 {data['message']}")
                     elif "providers" in data:
-                        providers = [p["id"] for p in data["providers"]]
-                        print(f"   📝 Providers: {', '.join(providers)}")
+                        print(f"   📝 Providers: {', '.join(map(itemgetter('id'), data['providers']))}")
                     elif "types" in data:
-                        types = [t["id"] for t in data["types"]]
-                        print(f"   📝 Types: {', '.join(types)}")
+                        print(f"   📝 Types: {', '.join(map(itemgetter('id'), data['types']))}")
                     elif "projects" in data:
                         print(f"   📝 Found {data.get('total', 0)} projects")
                 
-                self.results.append({"test": name, "success": True, "status": response.status_code})
+                self.results.append({"test": name, "success": True, "status": status})
             else:
-                print(f"❌ {name}: HTTP {response.status_code}")
-                print(f"   ⚠️  {response.text[:100]}...")
-                self.results.append({"test": name, "success": False, "status": response.status_code})
+                print(f"❌ {name}: HTTP {status}")
+                print(f"   ⚠️  {body[:100]}...")
+                self.results.append({"test": name, "success": False, "status": status})
                 
         except Exception as e:
             print(f"❌ {name}: {str(e)}")
@@ -60,35 +60,33 @@ class QuickBackendTester:
         
         print()
 
-    def run_tests(self):
+    async def run_tests(self):
         """Run all quick tests"""
         print("🚀 Starting Quick Backend Tests")
         print("=" * 60)
         
-        # Test 1: API Root
-        self.test_endpoint("API Root", "/")
-        
-        # Test 2: AI Providers
-        self.test_endpoint("AI Providers", "/ai-providers")
-        
-        # Test 3: Website Types
-        self.test_endpoint("Website Types", "/website-types")
+        # Every probe shares the keep-alive pool of the shared test session
+        session = get_session()
         
-        # Test 4: Projects List
-        self.test_endpoint("Projects List", "/projects")
-        
-        # Test 5: Templates
-        self.test_endpoint("Templates", "/templates")
+        # Tests 1-5 are read-only and run concurrently:
+        # API Root, AI Providers, Website Types, Projects List, Templates
+        await run_bounded(
+            self.test_endpoint(session, "API Root", "/", "HEAD"),
+            self.test_endpoint(session, "AI Providers", "/ai-providers"),
+            self.test_endpoint(session, "Website Types", "/website-types"),
+            self.test_endpoint(session, "Projects List", "/projects"),
+            self.test_endpoint(session, "Templates", "/templates", "HEAD")
+        )
         
         # Test 6: Database connectivity (legacy status endpoint)
         status_payload = {
             "status": "quick_test",
             "timestamp": datetime.now().isoformat()
         }
-        self.test_endpoint("Database Test", "/status", "POST", status_payload)
+        await self.test_endpoint(session, "Database Test", "/status", "POST", status_payload)
         
         # Test 7: Get status checks
-        self.test_endpoint("Get Status Checks", "/status")
+        await self.test_endpoint(session, "Get Status Checks", "/status")
         
         # Generate Summary
         self.generate_summary()
@@ -99,9 +97,12 @@ class QuickBackendTester:
         print("📊 QUICK TEST SUMMARY")
         print("=" * 60)
         
+        # Single pass: the failures are listed below, the passes only counted
+        failed_results = [r for r in self.results if not r["success"]]
+        
         total = len(self.results)
-        passed = sum(1 for r in self.results if r["success"])
-        failed = total - passed
+        failed = len(failed_results)
+        passed = total - failed
         
         print(f"Total Tests: {total}")
         print(f"✅ Passed: {passed}")
@@ -110,11 +111,10 @@ class QuickBackendTester:
         
         if failed > 0:
             print("\n❌ FAILED TESTS:")
-            for result in self.results:
-                if not result["success"]:
-                    error_info = result.get("error", f"HTTP {result.get('status', 'unknown')}")
-                    print(f"   • {result['test']}: {error_info}")
+            for result in failed_results:
+                error_info = result.get("error", f"HTTP {result.get('status', 'unknown')}")
+                print(f"   • {result['test']}: {error_info}")
 
 if __name__ == "__main__":
     tester = QuickBackendTester()
-    tester.run_tests()
\ No newline at end of file
+    run(tester.run_tests())
\ No newline at end of file
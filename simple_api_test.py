@@ -4,39 +4,69 @@ Simple API Test for Delete Functionality
 Tests the HTTP API endpoints with shorter timeouts
 """
 
-import requests
-import json
-import time
+import asyncio
+import aiohttp
+import orjson
 from datetime import datetime
 
+from test_support.env import load_backend_url
+from test_support.http import get_session, run
+
+async def _request(session, method, url):
+    """Issue a request and return its status with the decoded JSON body (None if not JSON)"""
+    async with session.request(method, url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+        try:
+            data = await response.json(content_type=None)
+        except ValueError:
+            data = None
+        return response.status, data
+
+def _unwrap(result):
+    """Re-raise an exception captured by asyncio.gather(return_exceptions=True)"""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
 def test_api_with_retries():
     """Test API with retries and shorter timeouts"""
+    run(main())
+
+async def main():
+    """Run the API checks on the shared session, overlapping the independent probes"""
     
     # Get backend URL
-    with open('/app/frontend/.env', 'r') as f:
-        for line in f:
-            if line.startswith('REACT_APP_BACKEND_URL='):
-                base_url = line.split('=')[1].strip()
-                break
-    
-    api_url = f"{base_url}/api"
+    api_url = f"{load_backend_url()}/api"
     
     print(f"🔧 Testing API at: {api_url}")
     print("=" * 60)
     
     results = []
     
+    await _run_checks(get_session(), api_url, results)
+    
+    _report(results)
+
+async def _run_checks(session, api_url, results):
+    """Probe the API and append (test, success, details) tuples to results"""
+    # API root, projects list and the 404 probe don't depend on each other
+    fake_id = "nonexistent-project-12345"
+    root, listing, not_found = await asyncio.gather(
+        _request(session, "GET", f"{api_url}/"),
+        _request(session, "GET", f"{api_url}/projects"),
+        _request(session, "DELETE", f"{api_url}/projects/{fake_id}"),
+        return_exceptions=True
+    )
+    
     # Test 1: API Root (quick test)
     print("🧪 Testing API Root...")
     try:
-        response = requests.get(f"{api_url}/", timeout=15)
-        if response.status_code == 200:
-            data = response.json()
+        status, data = _unwrap(root)
+        if status == 200:
             print(f"✅ API Root: {data.get('message', 'Unknown')}")
             results.append(("API Root", True, "Working"))
         else:
-            print(f"❌ API Root: HTTP {response.status_code}")
-            results.append(("API Root", False, f"HTTP {response.status_code}"))
+            print(f"❌ API Root: HTTP {status}")
+            results.append(("API Root", False, f"HTTP {status}"))
     except Exception as e:
         print(f"❌ API Root: {str(e)}")
         results.append(("API Root", False, str(e)))
@@ -44,9 +74,8 @@ def test_api_with_retries():
     # Test 2: Projects List
     print("\n🧪 Testing Projects List...")
     try:
-        response = requests.get(f"{api_url}/projects", timeout=15)
-        if response.status_code == 200:
-            data = response.json()
+        status, data = _unwrap(listing)
+        if status == 200:
             total = data.get('total', 0)
             print(f"✅ Projects List: Found {total} projects")
             results.append(("Projects List", True, f"{total} projects"))
@@ -60,18 +89,20 @@ def test_api_with_retries():
                     
                     print(f"\n🧪 Testing Project Deletion for ID: {project_id[:8]}...")
                     try:
-                        delete_response = requests.delete(f"{api_url}/projects/{project_id}", timeout=15)
-                        if delete_response.status_code == 200:
-                            delete_data = delete_response.json()
+                        delete_status, delete_data = await _request(session, "DELETE", f"{api_url}/projects/{project_id}")
+                        if delete_status == 200:
                             if delete_data.get('success'):
                                 print(f"✅ Project Deletion: Successfully deleted project")
                                 results.append(("Project Deletion", True, "Deleted successfully"))
                                 
-                                # Verify deletion
-                                time.sleep(2)
-                                verify_response = requests.get(f"{api_url}/projects", timeout=15)
-                                if verify_response.status_code == 200:
-                                    verify_data = verify_response.json()
+                                # Verify deletion, re-listing with backoff until the count drops
+                                # (the wait comes before each re-check, never after the last one)
+                                for delay in (0, 0.05, 0.1, 0.2, 0.4, 0.8):
+                                    await asyncio.sleep(delay)
+                                    verify_status, verify_data = await _request(session, "GET", f"{api_url}/projects")
+                                    if verify_status == 200 and verify_data.get('total', 0) == total - 1:
+                                        break
+                                if verify_status == 200:
                                     new_total = verify_data.get('total', 0)
                                     if new_total == total - 1:
                                         print(f"✅ Deletion Verification: Count decreased {total} → {new_total}")
@@ -83,15 +114,15 @@ def test_api_with_retries():
                                 print(f"❌ Project Deletion: {delete_data}")
                                 results.append(("Project Deletion", False, str(delete_data)))
                         else:
-                            print(f"❌ Project Deletion: HTTP {delete_response.status_code}")
-                            results.append(("Project Deletion", False, f"HTTP {delete_response.status_code}"))
+                            print(f"❌ Project Deletion: HTTP {delete_status}")
+                            results.append(("Project Deletion", False, f"HTTP {delete_status}"))
                     except Exception as e:
                         print(f"❌ Project Deletion: {str(e)}")
                         results.append(("Project Deletion", False, str(e)))
             
         else:
-            print(f"❌ Projects List: HTTP {response.status_code}")
-            results.append(("Projects List", False, f"HTTP {response.status_code}"))
+            print(f"❌ Projects List: HTTP {status}")
+            results.append(("Projects List", False, f"HTTP {status}"))
     except Exception as e:
         print(f"❌ Projects List: {str(e)}")
         results.append(("Projects List", False, str(e)))
@@ -99,18 +130,19 @@ def test_api_with_retries():
     # Test 3: 404 Error Handling
     print(f"\n🧪 Testing 404 Error Handling...")
     try:
-        fake_id = "nonexistent-project-12345"
-        response = requests.delete(f"{api_url}/projects/{fake_id}", timeout=15)
-        if response.status_code == 404:
+        status, _ = _unwrap(not_found)
+        if status == 404:
             print(f"✅ 404 Error Handling: Correctly returned 404")
             results.append(("404 Error Handling", True, "Correct 404 response"))
         else:
-            print(f"❌ 404 Error Handling: Expected 404, got {response.status_code}")
-            results.append(("404 Error Handling", False, f"Got {response.status_code}"))
+            print(f"❌ 404 Error Handling: Expected 404, got {status}")
+            results.append(("404 Error Handling", False, f"Got {status}"))
     except Exception as e:
         print(f"❌ 404 Error Handling: {str(e)}")
         results.append(("404 Error Handling", False, str(e)))
-    
+
+def _report(results):
+    """Print the summary and save the results file"""
     # Summary
     print("\n" + "=" * 60)
     print("📊 SIMPLE API TEST SUMMARY")
@@ -130,8 +162,8 @@ def test_api_with_retries():
         print(f"{status} {test_name}: {details}")
     
     # Save results
-    with open('/app/simple_api_test_results.json', 'w') as f:
-        json.dump({
+    with open('/app/simple_api_test_results.json', 'wb') as f:
+        f.write(orjson.dumps({
             "summary": {
                 "total": total_tests,
                 "passed": passed_tests,
@@ -140,7 +172,7 @@ def test_api_with_retries():
             },
             "results": [{"test": r[0], "success": r[1], "details": r[2]} for r in results],
             "timestamp": datetime.now().isoformat()
-        }, f, indent=2)
+        }, option=orjson.OPT_INDENT_2))
     
     print(f"\n📄 Results saved to: /app/simple_api_test_results.json")
 
@@ -5,44 +5,282 @@ Tests the recently fixed POST /api/enhance-project endpoint with apply=true
 """
 
 import requests
-import json
+import orjson
+import hashlib
+import time
 import sys
 import os
+import threading
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+
+from test_support.enhance import make_session
+from test_support.env import load_backend_url
+
+VISUAL_ENHANCEMENT = {
+    "type": "visual",
+    "title": "Mejorar Paleta de Colores",
+    "description": "Aplicar una paleta de colores moderna y profesional que mejore la legibilidad y el impacto visual",
+    "impact": "high",
+    "icon": "🎨"
+}
+
+CONTENT_ENHANCEMENT = {
+    "type": "content",
+    "title": "Optimizar Contenido",
+    "description": "Mejorar textos, llamadas a la acción y estructura del contenido para mayor conversión",
+    "impact": "high",
+    "icon": "📝"
+}
+
+CUSTOM_ENHANCEMENT = {
+    "prompt": "Add a testimonials section with 3 customer reviews and improve the call-to-action buttons to be more prominent",
+    "description": "Add testimonials section and improve CTA buttons"
+}
+
+CHAT_ENHANCEMENT = {
+    "message": "Make the website more modern with better colors and add some animations",
+    "description": "Modernize design with better colors and animations"
+}
+
+# (test name, modification_type, enhancement) of every apply-mode test
+APPLY_MODE_ENHANCEMENTS = (
+    ("Enhancement Apply Mode - Visual", "enhancement", VISUAL_ENHANCEMENT),
+    ("Enhancement Apply Mode - Content", "enhancement", CONTENT_ENHANCEMENT),
+    ("Custom Prompt Enhancement", "custom_prompt", CUSTOM_ENHANCEMENT),
+    ("Chat Interactive Enhancement", "chat_interactive", CHAT_ENHANCEMENT)
+)
+
+# AI_ENHANCE_TEST_MOCK=1 answers every backend call from the canned JSON in
+# FIXTURES_DIR, so CI runs the full suite in seconds without an LLM behind it
+MOCK = bool(os.environ.get("AI_ENHANCE_TEST_MOCK"))
+MOCK_BASE_URL = "http://mock-backend"
+FIXTURES_DIR = Path(__file__).resolve().parent / "tests" / "fixtures"
+
+# ENHANCE_USE_FIXTURE=1 stores this static site through the backend's test seed
+# route instead of generating one with an LLM
+FIXTURE_MODE = bool(os.environ.get("ENHANCE_USE_FIXTURE"))
+MINIMAL_HTML = (FIXTURES_DIR / "minimal_landing.html").read_text()
+MINIMAL_CSS = (FIXTURES_DIR / "minimal_landing.css").read_text()
+
+# Project generated by an earlier run, reused for up to SEED_MAX_AGE seconds
+SEEDED_PROJECT = FIXTURES_DIR / "seeded_project.json"
+SEED_MAX_AGE = 24 * 3600
+
+# ENHANCE_POST_CACHE=1 replays the response of a byte-identical earlier POST
+POST_CACHE = bool(os.environ.get("ENHANCE_POST_CACHE"))
+
+def _index_files(files) -> Dict[str, str]:
+    """Map filename to content for both the generator's dict and the database's list of files"""
+    if isinstance(files, dict):
+        return files
+    if isinstance(files, list):
+        return {f.get("filename", ""): f.get("content", "") for f in files if isinstance(f, dict)}
+    return {}
+
+def _html_file(files: Dict[str, str]):
+    """Return (filename, content) of the first HTML file, or empty strings"""
+    return next(((n, c) for n, c in files.items() if n.lower().endswith((".html", ".htm"))), ("", ""))
+
+def _file_digests(files) -> Dict[str, bytes]:
+    """Map each filename to a 16-byte digest of its content, for change detection"""
+    return {n: hashlib.blake2b(c.encode(), digest_size=16).digest() for n, c in _index_files(files).items()}
 
 class AIEnhancementTester:
-    def __init__(self):
+    # Per-call read budgets in seconds, further capped by the suite deadline
+    TIMEOUTS = {
+        "generate": 60,
+        "seed_project": 10,
+        "enhance_apply": 45,
+        "enhance_suggest": 20,
+        "ai_providers": 5,
+        "get_project": 5,
+        "delete_project": 10
+    }
+
+    def __init__(self, reseed: bool = False, verbose: bool = False):
+        self.mock = MOCK
+        self.fixture_mode = FIXTURE_MODE
+        self.reseed = reseed
+        self.verbose = verbose
+        
         # Get backend URL from frontend env
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_BACKEND_URL='):
-                    self.base_url = line.split('=')[1].strip()
-                    break
+        self.base_url = MOCK_BASE_URL if self.mock else load_backend_url()
         
         self.api_url = f"{self.base_url}/api"
         self.test_results = []
+        # One stuck call can't blow the whole run past SUITE_DEADLINE_S
+        self.deadline = time.monotonic() + int(os.environ.get("SUITE_DEADLINE_S", "180"))
+        # Encoded '{"project_id": ..., "current_content": ...' prefix per project
+        self._base_payload_bytes: Dict[str, bytes] = {}
+        # Decoded GET responses (monotonic fetch time, status, data) keyed by URL,
+        # and opt-in replayable POST responses keyed by a digest of URL and body
+        self._get_cache: Dict[str, tuple] = {}
+        self._post_cache: Dict[bytes, requests.Response] = {}
+        # Project stored by create_fixture_project, deleted again by close()
+        self._fixture_project_id: Optional[str] = None
+        # The provider check logs from a worker thread while the project is created
+        self._log_lock = threading.Lock()
+        self._log_buffer: List[str] = []
+        
+        # One pooled keep-alive session for every request in the suite
+        self.session = make_session()
+        self.session.headers["Content-Type"] = "application/json"
         
-        print(f"🔧 Testing AI Enhancement Functionality at: {self.api_url}")
+        self._mock_backend = self._start_mock_backend() if self.mock else None
+        if not self.mock:
+            self._prewarm_connection()
+        
+        print(f"🔧 Testing AI Enhancement Functionality at: {self.api_url}{' (mocked)' if self.mock else ''}")
         print("=" * 70)
 
+    def _prewarm_connection(self):
+        """Resolve DNS and open the pooled (TLS) connection before any test is timed"""
+        try:
+            # The API root answers HEAD without touching the database
+            self.session.head(f"{self.api_url}/", timeout=3)
+        except requests.RequestException as e:
+            print(f"⚠️  Could not prewarm connection to {self.api_url}: {e}")
+
+    def _start_mock_backend(self):
+        """Route the session's requests to canned fixture responses instead of the backend"""
+        import responses  # only needed in mock mode
+        
+        fixtures = {path.stem: orjson.loads(path.read_bytes()) for path in FIXTURES_DIR.glob("*.json")}
+        
+        def enhance(request):
+            # Same precedence as the backend: apply=true wins over enhancement_type
+            payload = orjson.loads(request.body)
+            if payload.get("apply") and payload.get("enhancement"):
+                body = fixtures["enhance_project_applied"]
+            elif payload.get("enhancement_type", "suggestions") == "suggestions":
+                body = fixtures["enhance_project_suggestions"]
+            else:
+                body = {"success": False, "error": "Invalid enhancement request"}
+            return 200, {"Content-Type": "application/json"}, orjson.dumps(body)
+        
+        project_id = fixtures["generate_website"]["project_id"]
+        mock = responses.RequestsMock(assert_all_requests_are_fired=False)
+        mock.add(responses.GET, f"{self.api_url}/ai-providers", json=fixtures["ai_providers"])
+        mock.add(responses.POST, f"{self.api_url}/generate-website", json=fixtures["generate_website"])
+        mock.add_callback(responses.POST, f"{self.api_url}/enhance-project", callback=enhance)
+        mock.add(responses.GET, f"{self.api_url}/projects/{project_id}", json=fixtures["project_enhanced"])
+        mock.start()
+        return mock
+
+    def close(self):
+        """Delete the seeded fixture project, if any, and release the HTTP session (and the mock backend)"""
+        if self._fixture_project_id:
+            try:
+                response = self.session.delete(f"{self.api_url}/projects/{self._fixture_project_id}", 
+                                               timeout=self.TIMEOUTS["delete_project"])
+                if response.status_code != 200:
+                    print(f"⚠️  Could not delete fixture project: HTTP {response.status_code}")
+            except requests.RequestException as e:
+                print(f"⚠️  Could not delete fixture project: {e}")
+            self._fixture_project_id = None
+        
+        self.session.close()
+        if self._mock_backend is not None:
+            self._mock_backend.stop()
+            self._mock_backend = None
+
     def log_test(self, test_name: str, success: bool, details: str = "", error: str = ""):
         """Log test results"""
         status = "✅ PASS" if success else "❌ FAIL"
-        self.test_results.append({
-            "test": test_name,
-            "success": success,
-            "details": details,
-            "error": error,
-            "timestamp": datetime.now().isoformat()
-        })
+        with self._log_lock:
+            self.test_results.append({
+                "test": test_name,
+                "success": success,
+                "details": details,
+                "error": error,
+                "ts_ns": time.time_ns()  # formatted when the results are saved
+            })
+            
+            
+            lines = [f"{status} {test_name}"]
+            if details:
+                lines.append(f"   📝 {details}")
+            if error:
+                lines.append(f"   ⚠️  {error}")
+            entry = "\n".join(lines) + "\n\n"
+            
+            # Workers don't contend for stdout: entries are written in one go
+            # by _flush_log unless the run is verbose
+            if self.verbose:
+                sys.stdout.write(entry)
+            else:
+                self._log_buffer.append(entry)
+
+    def _print(self, text: str = ""):
+        """Print a progress line in order with the logged results (buffered like them unless verbose)"""
+        with self._log_lock:
+            if self.verbose:
+                sys.stdout.write(text + "\n")
+            else:
+                self._log_buffer.append(text + "\n")
+
+    def _flush_log(self):
+        """Write the buffered log entries to stdout in a single call"""
+        with self._log_lock:
+            if self._log_buffer:
+                sys.stdout.write("".join(self._log_buffer))
+                self._log_buffer.clear()
+
+    def _timeout(self, name: str) -> float:
+        """Timeout for a call of the given kind, never running past the suite deadline"""
+        remaining = max(1, self.deadline - time.monotonic())
+        return min(self.TIMEOUTS[name], remaining)
+
+    def _post_enhance(self, project_data: Dict[str, Any], fields: Dict[str, Any], timeout: float) -> requests.Response:
+        """POST an enhancement payload, encoding the shared project_id/current_content prefix only once"""
+        project_id = project_data["project_id"]
+        prefix = self._base_payload_bytes.get(project_id)
+        if prefix is None:
+            # Drop the closing brace so the per-test fields can be spliced in
+            prefix = orjson.dumps({
+                "project_id": project_id,
+                "current_content": project_data["html_content"]
+            })[:-1]
+            self._base_payload_bytes[project_id] = prefix
         
-        print(f"{status} {test_name}")
-        if details:
-            print(f"   📝 {details}")
-        if error:
-            print(f"   ⚠️  {error}")
-        print()
+        body = prefix + b"," + orjson.dumps(fields)[1:]
+        return self._post_json(f"{self.api_url}/enhance-project", body, timeout=timeout)
+
+    def _post_json(self, url: str, payload, timeout: float) -> requests.Response:
+        """POST a JSON payload (dict or pre-encoded bytes) through the pooled session"""
+        body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+        
+        key = hashlib.blake2b(url.encode() + b"\0" + body, digest_size=16).digest() if POST_CACHE else None
+        if key in self._post_cache:
+            return self._post_cache[key]
+        
+        try:
+            response = self.session.post(url, data=body, timeout=timeout)
+        except requests.RequestException as e:
+            # Network errors surface as one short, uniform failure
+            raise ConnectionError(f"POST {url} failed ({type(e).__name__})") from e
+        
+        if key is not None and response.status_code == 200:
+            self._post_cache[key] = response
+        return response
+
+    def _get_json(self, url: str, timeout: float, ttl: float = 5):
+        """GET a JSON resource as (status, data), reusing a successful response fetched within ttl seconds"""
+        cached = self._get_cache.get(url)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1], cached[2]
+        
+        response = self.session.get(url, timeout=timeout)
+        if response.status_code != 200:
+            return response.status_code, None
+        
+        data = orjson.loads(response.content)
+        self._get_cache[url] = (time.monotonic(), 200, data)
+        return 200, data
 
     def create_test_project(self) -> Optional[Dict[str, Any]]:
         """Create a test project for enhancement testing"""
@@ -53,8 +291,8 @@ class AIEnhancementTester:
                 "provider": "openai"
             }
             
-            response = requests.post(f"{self.api_url}/generate-website", 
-                                   json=payload, timeout=60)
+            response = self._post_json(f"{self.api_url}/generate-website", payload, 
+                                       timeout=self._timeout("generate"))
             
             if response.status_code == 200:
                 data = response.json()
@@ -63,36 +301,105 @@ class AIEnhancementTester:
                     files = data.get("files", {})
                     
                     # Get HTML content for enhancement testing
-                    html_content = ""
-                    for filename, content in files.items():
-                        if "html" in filename.lower():
-                            html_content = content
-                            break
+                    html_filename, html_content = _html_file(files)
                     
                     return {
                         "project_id": project_id,
                         "files": files,
+                        "html_filename": html_filename,
                         "html_content": html_content
                     }
             
             return None
             
         except Exception as e:
-            print(f"Error creating test project: {e}")
+            self._print(f"Error creating test project: {e}")
             return None
 
+    def create_or_reuse_test_project(self) -> Optional[Dict[str, Any]]:
+        """Reuse the project seeded by a recent run, generating (and seeding) a new one otherwise"""
+        if self.fixture_mode and not self.mock:
+            project_data = self.create_fixture_project()
+            if project_data:
+                return project_data
+        
+        # The mocked backend generates for free and its stored project is already enhanced
+        if not (self.mock or self.reseed):
+            project_data = self._load_seeded_project()
+            if project_data:
+                return project_data
+        
+        project_data = self.create_test_project()
+        if project_data and not self.mock:
+            try:
+                SEEDED_PROJECT.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = SEEDED_PROJECT.with_suffix(".tmp")
+                tmp_path.write_bytes(orjson.dumps(project_data))
+                os.replace(tmp_path, SEEDED_PROJECT)
+            except OSError as e:
+                self._print(f"⚠️  Could not save seeded project: {e}")
+        return project_data
+
+    def create_fixture_project(self) -> Optional[Dict[str, Any]]:
+        """Store the static fixture site as a project, skipping the LLM (None if test routes are off)"""
+        files = {"index.html": MINIMAL_HTML, "styles.css": MINIMAL_CSS}
+        payload = {"name": "TechCorp Fixture Project", "files": files}
+        try:
+            response = self._post_json(f"{self.api_url}/projects/_test_seed", payload, 
+                                       timeout=self._timeout("seed_project"))
+            data = response.json() if response.status_code == 200 else {}
+        except Exception as e:
+            self._print(f"⚠️  Could not seed fixture project: {e}")
+            return None
+        
+        # 404 means the backend runs without ENABLE_TEST_ROUTES
+        if not data.get("success"):
+            self._print(f"⚠️  Fixture project rejected (HTTP {response.status_code}), generating one instead")
+            return None
+        
+        self._fixture_project_id = data["project_id"]
+        self._print(f"🧩 Using fixture project {data['project_id'][:8]}...")
+        return {
+            "project_id": data["project_id"],
+            "files": files,
+            "html_filename": "index.html",
+            "html_content": MINIMAL_HTML
+        }
+
+    def _load_seeded_project(self) -> Optional[Dict[str, Any]]:
+        """Load the seeded project if it is fresh and still exists in the backend"""
+        try:
+            if time.time() - SEEDED_PROJECT.stat().st_mtime >= SEED_MAX_AGE:
+                return None
+            seeded = orjson.loads(SEEDED_PROJECT.read_bytes())
+            
+            response = self.session.get(f"{self.api_url}/projects/{seeded['project_id']}", 
+                                        timeout=self._timeout("get_project"))
+            if response.status_code != 200:
+                return None
+        except (OSError, ValueError, KeyError, requests.RequestException):
+            return None
+        
+        # Earlier runs enhanced the stored files, so compare against what is there now
+        files = _index_files(response.json().get("files")) or seeded.get("files", {})
+        html_filename, html_content = _html_file(files)
+        self._print(f"♻️  Reusing seeded project {seeded['project_id'][:8]}...")
+        return {
+            "project_id": seeded["project_id"],
+            "files": files,
+            "html_filename": html_filename,
+            "html_content": html_content
+        }
+
     def test_enhance_project_suggestions_mode(self, project_data: Dict[str, Any]):
         """Test enhancement endpoint in suggestions mode (apply=false)"""
         try:
             payload = {
-                "project_id": project_data["project_id"],
-                "current_content": project_data["html_content"],
                 "enhancement_type": "suggestions",
                 "apply": False
             }
             
-            response = requests.post(f"{self.api_url}/enhance-project", 
-                                   json=payload, timeout=30)
+            response = self._post_enhance(project_data, payload, timeout=self._timeout("enhance_suggest"))
             
             if response.status_code == 200:
                 data = response.json()
@@ -121,24 +428,15 @@ class AIEnhancementTester:
     def test_enhance_project_apply_mode_visual(self, project_data: Dict[str, Any]):
         """Test enhancement endpoint with apply=true for visual improvements"""
         try:
-            enhancement = {
-                "type": "visual",
-                "title": "Mejorar Paleta de Colores",
-                "description": "Aplicar una paleta de colores moderna y profesional que mejore la legibilidad y el impacto visual",
-                "impact": "high",
-                "icon": "🎨"
-            }
+            enhancement = VISUAL_ENHANCEMENT
             
             payload = {
-                "project_id": project_data["project_id"],
-                "current_content": project_data["html_content"],
                 "enhancement": enhancement,
                 "apply": True,
                 "modification_type": "enhancement"
             }
             
-            response = requests.post(f"{self.api_url}/enhance-project", 
-                                   json=payload, timeout=90)
+            response = self._post_enhance(project_data, payload, timeout=self._timeout("enhance_apply"))
             
             if response.status_code == 200:
                 data = response.json()
@@ -148,9 +446,14 @@ class AIEnhancementTester:
                     enhanced_files = enhanced_project.get("files", {})
                     
                     if len(enhanced_files) > 0:
-                        # Verify files were actually enhanced
-                        has_html = any("html" in f.lower() for f in enhanced_files.keys())
-                        has_css = any("css" in f.lower() for f in enhanced_files.keys())
+                        # Verify files were actually enhanced, in one pass over the names
+                        has_html = has_css = False
+                        for f in enhanced_files:
+                            fl = f.lower()
+                            has_html = has_html or fl.endswith((".html", ".htm"))
+                            has_css = has_css or fl.endswith(".css")
+                            if has_html and has_css:
+                                break
                         
                         if has_html and has_css:
                             details = f"Successfully applied visual enhancement, generated {len(enhanced_files)} files"
@@ -177,24 +480,15 @@ class AIEnhancementTester:
     def test_enhance_project_apply_mode_content(self, project_data: Dict[str, Any]):
         """Test enhancement endpoint with apply=true for content improvements"""
         try:
-            enhancement = {
-                "type": "content",
-                "title": "Optimizar Contenido",
-                "description": "Mejorar textos, llamadas a la acción y estructura del contenido para mayor conversión",
-                "impact": "high",
-                "icon": "📝"
-            }
+            enhancement = CONTENT_ENHANCEMENT
             
             payload = {
-                "project_id": project_data["project_id"],
-                "current_content": project_data["html_content"],
                 "enhancement": enhancement,
                 "apply": True,
                 "modification_type": "enhancement"
             }
             
-            response = requests.post(f"{self.api_url}/enhance-project", 
-                                   json=payload, timeout=90)
+            response = self._post_enhance(project_data, payload, timeout=self._timeout("enhance_apply"))
             
             if response.status_code == 200:
                 data = response.json()
@@ -225,21 +519,15 @@ class AIEnhancementTester:
     def test_custom_prompt_enhancement(self, project_data: Dict[str, Any]):
         """Test custom prompt enhancement with apply=true"""
         try:
-            enhancement = {
-                "prompt": "Add a testimonials section with 3 customer reviews and improve the call-to-action buttons to be more prominent",
-                "description": "Add testimonials section and improve CTA buttons"
-            }
+            enhancement = CUSTOM_ENHANCEMENT
             
             payload = {
-                "project_id": project_data["project_id"],
-                "current_content": project_data["html_content"],
                 "enhancement": enhancement,
                 "apply": True,
                 "modification_type": "custom_prompt"
             }
             
-            response = requests.post(f"{self.api_url}/enhance-project", 
-                                   json=payload, timeout=90)
+            response = self._post_enhance(project_data, payload, timeout=self._timeout("enhance_apply"))
             
             if response.status_code == 200:
                 data = response.json()
@@ -270,21 +558,15 @@ class AIEnhancementTester:
     def test_chat_interactive_enhancement(self, project_data: Dict[str, Any]):
         """Test chat-style interactive enhancement with apply=true"""
         try:
-            enhancement = {
-                "message": "Make the website more modern with better colors and add some animations",
-                "description": "Modernize design with better colors and animations"
-            }
+            enhancement = CHAT_ENHANCEMENT
             
             payload = {
-                "project_id": project_data["project_id"],
-                "current_content": project_data["html_content"],
                 "enhancement": enhancement,
                 "apply": True,
                 "modification_type": "chat_interactive"
             }
             
-            response = requests.post(f"{self.api_url}/enhance-project", 
-                                   json=payload, timeout=90)
+            response = self._post_enhance(project_data, payload, timeout=self._timeout("enhance_apply"))
             
             if response.status_code == 200:
                 data = response.json()
@@ -312,20 +594,21 @@ class AIEnhancementTester:
         
         return None
 
-    def verify_project_updated_in_database(self, project_id: str, original_files: Dict[str, str]):
+    def verify_project_updated_in_database(self, project_id: str, original_hashes: Dict[str, bytes]):
         """Verify that the project was actually updated in the database"""
         try:
-            response = requests.get(f"{self.api_url}/projects/{project_id}", timeout=10)
+            status, updated_project = self._get_json(f"{self.api_url}/projects/{project_id}", 
+                                                     timeout=self._timeout("get_project"))
             
-            if response.status_code == 200:
-                updated_project = response.json()
-                updated_files = updated_project.get("files", {})
+            if status == 200:
+                updated_files = _index_files(updated_project.get("files", {}))
                 
                 # Check if files were actually updated
+                updated_hashes = _file_digests(updated_files)
                 files_changed = False
-                for filename, original_content in original_files.items():
-                    if filename in updated_files:
-                        if updated_files[filename] != original_content:
+                for filename, original_hash in original_hashes.items():
+                    if filename in updated_hashes:
+                        if updated_hashes[filename] != original_hash:
                             files_changed = True
                             break
                 
@@ -346,7 +629,7 @@ class AIEnhancementTester:
                                 error="Project files were not updated in database")
             else:
                 self.log_test("Database Update Verification", False, 
-                            error=f"Could not retrieve updated project: HTTP {response.status_code}")
+                            error=f"Could not retrieve updated project: HTTP {status}")
                 
         except Exception as e:
             self.log_test("Database Update Verification", False, error=str(e))
@@ -355,10 +638,9 @@ class AIEnhancementTester:
         """Test that AI service is properly integrated and accessible"""
         try:
             # Test by checking AI providers endpoint
-            response = requests.get(f"{self.api_url}/ai-providers", timeout=10)
+            status, data = self._get_json(f"{self.api_url}/ai-providers", timeout=self._timeout("ai_providers"))
             
-            if response.status_code == 200:
-                data = response.json()
+            if status == 200:
                 providers = data.get("providers", [])
                 
                 # Check if OpenAI is configured (used for enhancements)
@@ -377,7 +659,7 @@ class AIEnhancementTester:
                                 error="OpenAI provider not found")
             else:
                 self.log_test("AI Service Integration", False, 
-                            error=f"Could not verify AI providers: HTTP {response.status_code}")
+                            error=f"Could not verify AI providers: HTTP {status}")
                 
         except Exception as e:
             self.log_test("AI Service Integration", False, error=str(e))
@@ -396,15 +678,12 @@ class AIEnhancementTester:
             }
             
             payload = {
-                "project_id": project_data["project_id"],
-                "current_content": project_data["html_content"],
                 "enhancement": enhancement,
                 "enhancement_type": "suggestions",  # This should be ignored
                 "apply": True  # This should take priority
             }
             
-            response = requests.post(f"{self.api_url}/enhance-project", 
-                                   json=payload, timeout=90)
+            response = self._post_enhance(project_data, payload, timeout=self._timeout("enhance_apply"))
             
             if response.status_code == 200:
                 data = response.json()
@@ -435,23 +714,27 @@ class AIEnhancementTester:
         print("🚀 Starting AI Enhancement Functionality Testing")
         print("=" * 70)
         
-        # Test 1: AI Service Integration
-        self.test_ai_service_integration()
-        
-        # Test 2: Create test project
-        print("📝 Creating test project for enhancement testing...")
-        project_data = self.create_test_project()
+        # Test 1: AI Service Integration, checked in a worker thread while
+        # Test 2: Create test project is generating (neither needs the other)
+        self._print("📝 Creating test project for enhancement testing...")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            providers_check = executor.submit(self.test_ai_service_integration)
+            project_data = self.create_or_reuse_test_project()
+            providers_check.result()
         
         if not project_data:
             self.log_test("Test Project Creation", False, 
                         error="Could not create test project for enhancement testing")
+            self._flush_log()
+            self.close()
             return
         
         self.log_test("Test Project Creation", True, 
                     f"Created project {project_data['project_id'][:8]}... with {len(project_data['files'])} files")
         
-        # Store original files for comparison
-        original_files = project_data["files"].copy()
+        # Snapshot content digests of the original files for comparison; the
+        # tests below only need html_content, so the file bodies can be freed
+        original_hashes = _file_digests(project_data.pop("files"))
         
         # Test 3: Enhancement Suggestions Mode (apply=false)
         self.test_enhance_project_suggestions_mode(project_data)
@@ -459,33 +742,40 @@ class AIEnhancementTester:
         # Test 4: Enhancement Priority Logic (apply=true takes priority)
         self.test_enhancement_priority_logic(project_data)
         
-        # Test 5: Visual Enhancement with apply=true
+        # Tests 5-8: Visual, Content, Custom Prompt, Chat Interactive with apply=true
+        # Each one stores its result on the same project, so they run one after another
+        # and the database verification sees the last successful enhancement
         enhanced_visual = self.test_enhance_project_apply_mode_visual(project_data)
-        
-        # Test 6: Content Enhancement with apply=true
         enhanced_content = self.test_enhance_project_apply_mode_content(project_data)
-        
-        # Test 7: Custom Prompt Enhancement with apply=true
         enhanced_custom = self.test_custom_prompt_enhancement(project_data)
-        
-        # Test 8: Chat Interactive Enhancement with apply=true
         enhanced_chat = self.test_chat_interactive_enhancement(project_data)
         
         # Test 9: Verify Database Updates
         if enhanced_visual or enhanced_content or enhanced_custom or enhanced_chat:
-            self.verify_project_updated_in_database(project_data["project_id"], original_files)
+            self.verify_project_updated_in_database(project_data["project_id"], original_hashes)
         
         # Generate Summary
         self.generate_summary()
+        
+        self.close()
 
     def generate_summary(self):
         """Generate test summary"""
+        self._flush_log()
+        
         print("=" * 70)
         print("📊 AI ENHANCEMENT TEST SUMMARY")
         print("=" * 70)
         
+        # One pass collects the counts and both listings
+        passed_tests, failed_msgs, passed_names = 0, [], []
+        for r in self.test_results:
+            if r["success"]:
+                passed_tests += 1
+                passed_names.append(f"   • {r['test']}")
+            else:
+                failed_msgs.append(f"   • {r['test']}: {r['error']}")
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for r in self.test_results if r["success"])
         failed_tests = total_tests - passed_tests
         
         print(f"Total Tests: {total_tests}")
@@ -496,33 +786,45 @@ class AIEnhancementTester:
         
         if failed_tests > 0:
             print("❌ FAILED TESTS:")
-            for result in self.test_results:
-                if not result["success"]:
-                    print(f"   • {result['test']}: {result['error']}")
+            print("\n".join(failed_msgs))
             print()
         
         print("✅ PASSED TESTS:")
-        for result in self.test_results:
-            if result["success"]:
-                print(f"   • {result['test']}")
+        if passed_names:
+            print("\n".join(passed_names))
         
         print("\n" + "=" * 70)
         
-        # Save detailed results
-        with open('/app/ai_enhancement_test_results.json', 'w') as f:
-            json.dump({
-                "summary": {
-                    "total": total_tests,
-                    "passed": passed_tests,
-                    "failed": failed_tests,
-                    "success_rate": (passed_tests/total_tests)*100
-                },
-                "results": self.test_results,
-                "timestamp": datetime.now().isoformat()
-            }, f, indent=2)
+        # Save detailed results, written to a temp file in one go and renamed
+        # into place so readers never see a partially written report
+        results_path = '/app/ai_enhancement_test_results.json'
+        data = orjson.dumps({
+            "summary": {
+                "total": total_tests,
+                "passed": passed_tests,
+                "failed": failed_tests,
+                "success_rate": (passed_tests/total_tests)*100
+            },
+            "results": [
+                {**{k: v for k, v in r.items() if k != "ts_ns"}, 
+                 "timestamp": datetime.fromtimestamp(r["ts_ns"] / 1e9).isoformat()}
+                for r in self.test_results
+            ],
+            "timestamp": datetime.now().isoformat()
+        }, option=orjson.OPT_INDENT_2)
+        with open(f"{results_path}.tmp", 'wb') as f:
+            f.write(data)
+        os.replace(f"{results_path}.tmp", results_path)
         
         print("📄 Detailed results saved to: /app/ai_enhancement_test_results.json")
 
 if __name__ == "__main__":
-    tester = AIEnhancementTester()
+    parser = argparse.ArgumentParser(description="AI enhancement functionality tests")
+    parser.add_argument("--reseed", action="store_true", 
+                        help="generate a new test project instead of reusing the seeded one")
+    parser.add_argument("-v", "--verbose", action="store_true", 
+                        help="print each result as it is logged instead of with the summary")
+    args = parser.parse_args()
+    
+    tester = AIEnhancementTester(reseed=args.reseed, verbose=args.verbose)
     tester.run_all_enhancement_tests()
\ No newline at end of file
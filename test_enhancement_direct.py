@@ -6,20 +6,127 @@ Tests the enhance-project endpoint directly without creating projects
 
 import requests
 import json
+import orjson
+import hashlib
+import os
 import uuid
-from datetime import datetime
+import threading
+import time
+import asyncio
+from pathlib import Path
+
+from test_support.enhance import (
+    COMMON_HEADERS,
+    MOCK_LOGIC,
+    SAMPLE_HTML,
+    get_providers,
+    json_body,
+    logic_mock,
+    make_session
+)
+from test_support.env import load_backend_url
+
+# Resolved once per run instead of re-reading the frontend env in every test
+_BASE_URL = load_backend_url()
+_API_URL = f"{_BASE_URL}/api"
+
+# Realistic P99 of an apply=true LLM call; a slower response fails (POSTs are not re-sent,
+# see RETRY) rather than being waited on for 90s
+_APPLY_READ_TIMEOUT = 45
+
+# Every request sends the same current_content, so its JSON encoding ('"current_content":"..."')
+# is built once and spliced into each body
+_BASE_PAYLOAD_BYTES = json.dumps({"current_content": SAMPLE_HTML}, separators=(",", ":"))[1:-1].encode("utf-8")
+
+def _encode_payload(payload: dict) -> bytes:
+    """Encode a payload as compact JSON, reusing the pre-encoded sample page when it is sent"""
+    if payload.get("current_content") != SAMPLE_HTML:
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    
+    fields = {k: v for k, v in payload.items() if k != "current_content"}
+    if not fields:
+        return b"{" + _BASE_PAYLOAD_BYTES + b"}"
+    # Drop the opening brace so the per-test fields follow the shared one
+    return b"{" + _BASE_PAYLOAD_BYTES + b"," + json.dumps(fields, separators=(",", ":"))[1:].encode("utf-8")
+
+# (label, enhancement, modification_type, file kinds the enhanced project must contain)
+# for every apply=true test
+ENHANCEMENT_CASES = [
+    ("visual", {
+        "type": "visual",
+        "title": "Mejorar Paleta de Colores",
+        "description": "Aplicar una paleta de colores moderna y profesional que mejore la legibilidad y el impacto visual",
+        "impact": "high",
+        "icon": "🎨"
+    }, "enhancement", ("html", "css")),
+    ("content", {
+        "type": "content",
+        "title": "Optimizar Contenido",
+        "description": "Mejorar textos, llamadas a la acción y estructura del contenido para mayor conversión",
+        "impact": "high",
+        "icon": "📝"
+    }, "enhancement", ()),
+    ("custom_prompt", {
+        "prompt": "Add a testimonials section with 3 customer reviews and improve the call-to-action buttons to be more prominent",
+        "description": "Add testimonials section and improve CTA buttons"
+    }, "custom_prompt", ()),
+    ("chat_interactive", {
+        "message": "Make the website more modern with better colors and add some animations",
+        "description": "Modernize design with better colors and animations"
+    }, "chat_interactive", ())
+]
+_APPLY_TEST_NAMES = {
+    "visual": "Enhancement Apply Mode - Visual",
+    "content": "Enhancement Apply Mode - Content",
+    "custom_prompt": "Custom Prompt Enhancement",
+    "chat_interactive": "Chat Interactive Enhancement"
+}
+
+# Sent with apply=true and enhancement_type=suggestions by the priority-logic test
+PRIORITY_ENHANCEMENT = {
+    "type": "performance",
+    "title": "Optimización SEO",
+    "description": "Mejorar meta tags, estructura semántica y rendimiento para mejor posicionamiento",
+    "impact": "medium",
+    "icon": "🚀"
+}
+
+# ENHANCE_BATCH=1 sends the four apply-mode enhancements in a single request
+BATCH = bool(os.environ.get("ENHANCE_BATCH"))
+
+# ENHANCE_TEST_CACHE=1 replays successful enhancement responses from disk on re-runs
+CACHE = bool(os.environ.get("ENHANCE_TEST_CACHE"))
+CACHE_DIR = Path(__file__).resolve().parent / ".test_cache"
+
+# FAIL_FAST=1 skips the slow apply-mode tests once a prerequisite test has failed
+FAIL_FAST = bool(os.environ.get("FAIL_FAST"))
+# project_id is a fresh uuid4 per run, so only these fields identify a request
+_CACHE_KEYS = ("current_content", "enhancement", "modification_type", "enhancement_type", "apply")
+
+class _CachedResponse:
+    """A replayed response exposing the parts of requests.Response the tests read"""
+    
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.headers = {"content-type": "application/json"}
+    
+    def json(self):
+        return orjson.loads(self.content)
 
 class DirectEnhancementTester:
     def __init__(self):
-        # Get backend URL from frontend env
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_BACKEND_URL='):
-                    self.base_url = line.split('=')[1].strip()
-                    break
-        
-        self.api_url = f"{self.base_url}/api"
+        self.base_url = _BASE_URL
+        self.api_url = _API_URL
         self.test_results = []
+        # Results are stamped with monotonic_ns() and shown relative to this at summary time
+        self._start_ns = time.monotonic_ns()
+        # Apply-mode tests log from worker threads
+        self._log_lock = threading.Lock()
+        
+        # One pooled keep-alive session for every request in the suite
+        self.session = make_session()
         
         print(f"🔧 Testing AI Enhancement Endpoint at: {self.api_url}")
         print("=" * 70)
@@ -27,48 +134,76 @@ class DirectEnhancementTester:
     def log_test(self, test_name: str, success: bool, details: str = "", error: str = ""):
         """Log test results"""
         status = "✅ PASS" if success else "❌ FAIL"
-        self.test_results.append({
-            "test": test_name,
-            "success": success,
-            "details": details,
-            "error": error,
-            "timestamp": datetime.now().isoformat()
-        })
+        with self._log_lock:
+            self.test_results.append({
+                "test": test_name,
+                "success": success,
+                "details": details,
+                "error": error,
+                "t_ns": time.monotonic_ns()
+            })
+            
+            print(f"{status} {test_name}")
+            if details:
+                print(f"   📝 {details}")
+            if error:
+                print(f"   ⚠️  {error}")
+            print()
+
+    def _post(self, url: str, payload: dict, timeout: float):
+        """POST a payload as pre-encoded compact JSON, failing fast if the backend can't be reached"""
+        return self.session.post(url, data=_encode_payload(payload), headers=COMMON_HEADERS, timeout=(5, timeout))
+
+    def _cached_post(self, url: str, payload: dict, timeout: float):
+        """POST a JSON payload, replaying a cached response when ENHANCE_TEST_CACHE is set"""
+        if not CACHE:
+            return self._post(url, payload, timeout)
         
-        print(f"{status} {test_name}")
-        if details:
-            print(f"   📝 {details}")
-        if error:
-            print(f"   ⚠️  {error}")
-        print()
+        key = hashlib.sha256(json.dumps({k: payload[k] for k in _CACHE_KEYS if k in payload}, 
+                                        sort_keys=True).encode()).hexdigest()
+        cache_path = CACHE_DIR / f"{key}.json"
+        try:
+            cached = json.loads(cache_path.read_text())
+            return _CachedResponse(cached["status"], cached["body"])
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        response = self._post(url, payload, timeout)
+        # Only successes are worth replaying, a failure should hit the backend again next run
+        if response.status_code == 200:
+            try:
+                CACHE_DIR.mkdir(exist_ok=True)
+                tmp_path = cache_path.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps({"status": response.status_code, "body": response.text}))
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f"⚠️  Could not cache {url}: {e}")
+        return response
+
+    def _logic_post(self, payload: dict, fixture: str, timeout: float):
+        """POST a logic-only enhancement request, answered from tests/fixtures/<fixture>.json when mocking"""
+        url = f"{self.api_url}/enhance-project"
+        if not MOCK_LOGIC:
+            return self._cached_post(url, payload, timeout)
+        
+        # Mocked answers bypass the disk cache so they are never replayed into a live run
+        with logic_mock(url, fixture):
+            return self._post(url, payload, timeout)
 
     def test_enhancement_suggestions_mode(self):
         """Test enhancement endpoint in suggestions mode (apply=false)"""
         try:
-            sample_html = """
-            <!DOCTYPE html>
-            <html>
-            <head><title>Test Website</title></head>
-            <body>
-                <h1>Welcome to TechCorp</h1>
-                <p>We are a software development company.</p>
-                <button>Contact Us</button>
-            </body>
-            </html>
-            """
-            
             payload = {
                 "project_id": str(uuid.uuid4()),
-                "current_content": sample_html,
+                "current_content": SAMPLE_HTML,
                 "enhancement_type": "suggestions",
                 "apply": False
             }
             
-            response = requests.post(f"{self.api_url}/enhance-project", 
-                                   json=payload, timeout=30)
+            response = self._logic_post(payload, "enhance_project_suggestions", timeout=30)
             
             if response.status_code == 200:
-                data = response.json()
+                data = json_body(response)
                 
                 if data.get("success") and "suggestions" in data:
                     suggestions = data.get("suggestions", [])
@@ -91,292 +226,117 @@ class DirectEnhancementTester:
         
         return False
 
-    def test_enhancement_apply_mode_visual(self):
-        """Test enhancement endpoint with apply=true for visual improvements"""
+    def test_apply_mode(self, label: str, enhancement: dict, mod_type: str, required_files: tuple):
+        """Test enhancement endpoint with apply=true for one of ENHANCEMENT_CASES"""
+        test_name = _APPLY_TEST_NAMES[label]
         try:
-            sample_html = """
-            <!DOCTYPE html>
-            <html>
-            <head><title>Test Website</title></head>
-            <body>
-                <h1>Welcome to TechCorp</h1>
-                <p>We are a software development company.</p>
-                <button>Contact Us</button>
-            </body>
-            </html>
-            """
-            
-            enhancement = {
-                "type": "visual",
-                "title": "Mejorar Paleta de Colores",
-                "description": "Aplicar una paleta de colores moderna y profesional que mejore la legibilidad y el impacto visual",
-                "impact": "high",
-                "icon": "🎨"
-            }
-            
             payload = {
                 "project_id": str(uuid.uuid4()),
-                "current_content": sample_html,
+                "current_content": SAMPLE_HTML,
                 "enhancement": enhancement,
                 "apply": True,
-                "modification_type": "enhancement"
+                "modification_type": mod_type
             }
             
-            response = requests.post(f"{self.api_url}/enhance-project", 
-                                   json=payload, timeout=90)
+            response = self._cached_post(f"{self.api_url}/enhance-project", payload, timeout=_APPLY_READ_TIMEOUT)
             
             if response.status_code == 200:
-                data = response.json()
+                data = json_body(response)
                 
                 if data.get("success") and "enhanced_project" in data:
                     enhanced_project = data.get("enhanced_project", {})
                     enhanced_files = enhanced_project.get("files", {})
                     
                     if len(enhanced_files) > 0:
-                        # Verify files were actually enhanced
-                        has_html = any("html" in f.lower() for f in enhanced_files.keys())
-                        has_css = any("css" in f.lower() for f in enhanced_files.keys())
+                        # Verify the essential files were actually enhanced
+                        missing = [ext for ext in required_files 
+                                   if not any(ext in f.lower() for f in enhanced_files.keys())]
                         
-                        if has_html and has_css:
-                            details = f"Successfully applied visual enhancement, generated {len(enhanced_files)} files"
-                            self.log_test("Enhancement Apply Mode - Visual", True, details)
+                        if not missing:
+                            details = f"Successfully applied {label.replace('_', ' ')} enhancement, generated {len(enhanced_files)} files"
+                            self.log_test(test_name, True, details)
                             return enhanced_project
                         else:
-                            self.log_test("Enhancement Apply Mode - Visual", False, 
+                            self.log_test(test_name, False, 
                                         error="Missing essential files in enhanced project")
                     else:
-                        self.log_test("Enhancement Apply Mode - Visual", False, 
+                        self.log_test(test_name, False, 
                                     error="No enhanced files generated")
                 else:
-                    self.log_test("Enhancement Apply Mode - Visual", False, 
+                    self.log_test(test_name, False, 
                                 error=f"Enhancement failed: {data.get('error', 'Unknown error')}")
             else:
-                self.log_test("Enhancement Apply Mode - Visual", False, 
+                self.log_test(test_name, False, 
                             error=f"HTTP {response.status_code}: {response.text}")
                 
         except Exception as e:
-            self.log_test("Enhancement Apply Mode - Visual", False, error=str(e))
+            self.log_test(test_name, False, error=str(e))
         
         return None
 
-    def test_enhancement_apply_mode_content(self):
-        """Test enhancement endpoint with apply=true for content improvements"""
-        try:
-            sample_html = """
-            <!DOCTYPE html>
-            <html>
-            <head><title>Test Website</title></head>
-            <body>
-                <h1>Welcome to TechCorp</h1>
-                <p>We are a software development company.</p>
-                <button>Contact Us</button>
-            </body>
-            </html>
-            """
-            
-            enhancement = {
-                "type": "content",
-                "title": "Optimizar Contenido",
-                "description": "Mejorar textos, llamadas a la acción y estructura del contenido para mayor conversión",
-                "impact": "high",
-                "icon": "📝"
-            }
-            
-            payload = {
-                "project_id": str(uuid.uuid4()),
-                "current_content": sample_html,
-                "enhancement": enhancement,
-                "apply": True,
-                "modification_type": "enhancement"
-            }
-            
-            response = requests.post(f"{self.api_url}/enhance-project", 
-                                   json=payload, timeout=90)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if data.get("success") and "enhanced_project" in data:
-                    enhanced_project = data.get("enhanced_project", {})
-                    enhanced_files = enhanced_project.get("files", {})
-                    
-                    if len(enhanced_files) > 0:
-                        details = f"Successfully applied content enhancement, generated {len(enhanced_files)} files"
-                        self.log_test("Enhancement Apply Mode - Content", True, details)
-                        return enhanced_project
-                    else:
-                        self.log_test("Enhancement Apply Mode - Content", False, 
-                                    error="No enhanced files generated")
-                else:
-                    self.log_test("Enhancement Apply Mode - Content", False, 
-                                error=f"Enhancement failed: {data.get('error', 'Unknown error')}")
-            else:
-                self.log_test("Enhancement Apply Mode - Content", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("Enhancement Apply Mode - Content", False, error=str(e))
+    def test_apply_mode_batch(self) -> bool:
+        """Apply every ENHANCEMENT_CASES enhancement in one batched request (False if batching is unsupported)"""
+        # Each job gets its own project, like the single requests, so their writes don't collide
+        payload = {
+            "current_content": SAMPLE_HTML,
+            "batch": [
+                {"project_id": str(uuid.uuid4()), "enhancement": enhancement, "modification_type": mod_type}
+                for _, enhancement, mod_type, _ in ENHANCEMENT_CASES
+            ],
+            "apply": True
+        }
         
-        return None
-
-    def test_custom_prompt_enhancement(self):
-        """Test custom prompt enhancement with apply=true"""
         try:
-            sample_html = """
-            <!DOCTYPE html>
-            <html>
-            <head><title>Test Website</title></head>
-            <body>
-                <h1>Welcome to TechCorp</h1>
-                <p>We are a software development company.</p>
-                <button>Contact Us</button>
-            </body>
-            </html>
-            """
-            
-            enhancement = {
-                "prompt": "Add a testimonials section with 3 customer reviews and improve the call-to-action buttons to be more prominent",
-                "description": "Add testimonials section and improve CTA buttons"
-            }
-            
-            payload = {
-                "project_id": str(uuid.uuid4()),
-                "current_content": sample_html,
-                "enhancement": enhancement,
-                "apply": True,
-                "modification_type": "custom_prompt"
-            }
-            
-            response = requests.post(f"{self.api_url}/enhance-project", 
-                                   json=payload, timeout=90)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if data.get("success") and "enhanced_project" in data:
-                    enhanced_project = data.get("enhanced_project", {})
-                    enhanced_files = enhanced_project.get("files", {})
-                    
-                    if len(enhanced_files) > 0:
-                        details = f"Successfully applied custom prompt enhancement, generated {len(enhanced_files)} files"
-                        self.log_test("Custom Prompt Enhancement", True, details)
-                        return enhanced_project
-                    else:
-                        self.log_test("Custom Prompt Enhancement", False, 
-                                    error="No enhanced files generated")
-                else:
-                    self.log_test("Custom Prompt Enhancement", False, 
-                                error=f"Enhancement failed: {data.get('error', 'Unknown error')}")
-            else:
-                self.log_test("Custom Prompt Enhancement", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
-                
+            response = self._post(f"{self.api_url}/enhance-project-batch", payload, timeout=90)
+            data = json_body(response) if response.status_code == 200 else {}
         except Exception as e:
-            self.log_test("Custom Prompt Enhancement", False, error=str(e))
+            print(f"⚠️  Batch enhancement failed, falling back to single requests: {e}")
+            return False
         
-        return None
-
-    def test_chat_interactive_enhancement(self):
-        """Test chat-style interactive enhancement with apply=true"""
-        try:
-            sample_html = """
-            <!DOCTYPE html>
-            <html>
-            <head><title>Test Website</title></head>
-            <body>
-                <h1>Welcome to TechCorp</h1>
-                <p>We are a software development company.</p>
-                <button>Contact Us</button>
-            </body>
-            </html>
-            """
-            
-            enhancement = {
-                "message": "Make the website more modern with better colors and add some animations",
-                "description": "Modernize design with better colors and animations"
-            }
-            
-            payload = {
-                "project_id": str(uuid.uuid4()),
-                "current_content": sample_html,
-                "enhancement": enhancement,
-                "apply": True,
-                "modification_type": "chat_interactive"
-            }
-            
-            response = requests.post(f"{self.api_url}/enhance-project", 
-                                   json=payload, timeout=90)
+        results = data.get("results")
+        if not isinstance(results, list) or len(results) != len(ENHANCEMENT_CASES):
+            print(f"⚠️  Batch enhancement not supported (HTTP {response.status_code}), falling back to single requests")
+            return False
+        
+        # Sub-results come back in the order the enhancements were sent
+        for (label, _, _, required_files), result in zip(ENHANCEMENT_CASES, results):
+            enhanced_files = (result.get("enhanced_project") or {}).get("files", {})
+            missing = [ext for ext in required_files 
+                       if not any(ext in f.lower() for f in enhanced_files.keys())]
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                if data.get("success") and "enhanced_project" in data:
-                    enhanced_project = data.get("enhanced_project", {})
-                    enhanced_files = enhanced_project.get("files", {})
-                    
-                    if len(enhanced_files) > 0:
-                        details = f"Successfully applied chat interactive enhancement, generated {len(enhanced_files)} files"
-                        self.log_test("Chat Interactive Enhancement", True, details)
-                        return enhanced_project
-                    else:
-                        self.log_test("Chat Interactive Enhancement", False, 
-                                    error="No enhanced files generated")
-                else:
-                    self.log_test("Chat Interactive Enhancement", False, 
-                                error=f"Enhancement failed: {data.get('error', 'Unknown error')}")
+            if result.get("success") and len(enhanced_files) > 0 and not missing:
+                details = f"Applied in batch, generated {len(enhanced_files)} files"
+                self.log_test(_APPLY_TEST_NAMES[label], True, details)
             else:
-                self.log_test("Chat Interactive Enhancement", False, 
-                            error=f"HTTP {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            self.log_test("Chat Interactive Enhancement", False, error=str(e))
+                self.log_test(_APPLY_TEST_NAMES[label], False, 
+                            error=f"Enhancement failed: {result.get('error', 'Missing essential files in enhanced project')}")
         
-        return None
+        return True
 
     def test_enhancement_priority_logic(self):
         """Test that apply=true takes priority over enhancement_type"""
         try:
-            sample_html = """
-            <!DOCTYPE html>
-            <html>
-            <head><title>Test Website</title></head>
-            <body>
-                <h1>Welcome to TechCorp</h1>
-                <p>We are a software development company.</p>
-                <button>Contact Us</button>
-            </body>
-            </html>
-            """
-            
             # Send request with apply=true AND enhancement_type=suggestions
             # Should apply enhancement, not return suggestions
-            enhancement = {
-                "type": "performance",
-                "title": "Optimización SEO",
-                "description": "Mejorar meta tags, estructura semántica y rendimiento para mejor posicionamiento",
-                "impact": "medium",
-                "icon": "🚀"
-            }
-            
             payload = {
                 "project_id": str(uuid.uuid4()),
-                "current_content": sample_html,
-                "enhancement": enhancement,
+                "current_content": SAMPLE_HTML,
+                "enhancement": PRIORITY_ENHANCEMENT,
                 "enhancement_type": "suggestions",  # This should be ignored
                 "apply": True  # This should take priority
             }
             
-            response = requests.post(f"{self.api_url}/enhance-project", 
-                                   json=payload, timeout=90)
+            response = self._logic_post(payload, "enhance_project_applied", timeout=90)
             
             if response.status_code == 200:
-                data = response.json()
+                data = json_body(response)
                 
                 # Should return enhanced_project, NOT suggestions
                 if data.get("success"):
                     if "enhanced_project" in data and "suggestions" not in data:
                         details = "apply=true correctly took priority over enhancement_type=suggestions"
                         self.log_test("Enhancement Priority Logic", True, details)
+                        return True
                     elif "suggestions" in data:
                         self.log_test("Enhancement Priority Logic", False, 
                                     error="Returned suggestions instead of applying enhancement")
@@ -392,15 +352,16 @@ class DirectEnhancementTester:
                 
         except Exception as e:
             self.log_test("Enhancement Priority Logic", False, error=str(e))
+        
+        return False
 
     def test_ai_service_integration(self):
         """Test that AI service is properly integrated and accessible"""
         try:
             # Test by checking AI providers endpoint
-            response = requests.get(f"{self.api_url}/ai-providers", timeout=10)
+            status, data = get_providers(self.session, self.api_url)
             
-            if response.status_code == 200:
-                data = response.json()
+            if status == 200:
                 providers = data.get("providers", [])
                 
                 # Check if OpenAI is configured (used for enhancements)
@@ -411,6 +372,7 @@ class DirectEnhancementTester:
                     if "gpt-4" in model.lower():
                         details = f"AI service integrated with {model} for enhancements"
                         self.log_test("AI Service Integration", True, details)
+                        return True
                     else:
                         self.log_test("AI Service Integration", False, 
                                     error=f"Unexpected model: {model}")
@@ -419,39 +381,75 @@ class DirectEnhancementTester:
                                 error="OpenAI provider not found")
             else:
                 self.log_test("AI Service Integration", False, 
-                            error=f"Could not verify AI providers: HTTP {response.status_code}")
+                            error=f"Could not verify AI providers: HTTP {status}")
                 
         except Exception as e:
             self.log_test("AI Service Integration", False, error=str(e))
+        
+        return False
+
+    def _backend_alive(self) -> bool:
+        """One cheap HEAD on the API root (there is no /health route), bypassing the session's retries"""
+        try:
+            return requests.head(f"{self.api_url}/", timeout=(2, 3)).status_code < 500
+        except requests.RequestException:
+            return False
+
+    async def _run_apply_tests(self):
+        """Tests 4-7, batched into one request when enabled and supported"""
+        # On an outage the apply-mode tests are skipped instead of each running into its read timeout
+        if not await asyncio.to_thread(self._backend_alive):
+            for label, *_ in ENHANCEMENT_CASES:
+                self.log_test(_APPLY_TEST_NAMES[label], False, 
+                            error=f"Skipped: backend at {self.api_url} not reachable")
+            return
+        
+        if BATCH and await asyncio.to_thread(self.test_apply_mode_batch):
+            return
+        
+        await asyncio.gather(*(asyncio.to_thread(self.test_apply_mode, *case) for case in ENHANCEMENT_CASES))
 
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all enhancement tests"""
         print("🚀 Starting Direct AI Enhancement Testing")
         print("=" * 70)
         
-        # Test 1: AI Service Integration
-        self.test_ai_service_integration()
-        
-        # Test 2: Enhancement Suggestions Mode (apply=false)
-        self.test_enhancement_suggestions_mode()
-        
-        # Test 3: Enhancement Priority Logic (apply=true takes priority)
-        self.test_enhancement_priority_logic()
-        
-        # Test 4: Visual Enhancement with apply=true
-        self.test_enhancement_apply_mode_visual()
+        # Tests 2-3 swap the process-wide requests transport for a mock while they run,
+        # so when mocked they go first, on their own (and finish instantly)
+        if MOCK_LOGIC:
+            suggestions_ok = self.test_enhancement_suggestions_mode()
+            logic_ok = self.test_enhancement_priority_logic() and suggestions_ok
+            logic_tests = ()
+        else:
+            logic_ok = True
+            logic_tests = (self.test_enhancement_suggestions_mode, self.test_enhancement_priority_logic)
         
-        # Test 5: Content Enhancement with apply=true
-        self.test_enhancement_apply_mode_content()
+        prerequisites = [
+            asyncio.to_thread(self.test_ai_service_integration),
+            *(asyncio.to_thread(test) for test in logic_tests)
+        ]
         
-        # Test 6: Custom Prompt Enhancement with apply=true
-        self.test_custom_prompt_enhancement()
-        
-        # Test 7: Chat Interactive Enhancement with apply=true
-        self.test_chat_interactive_enhancement()
+        if FAIL_FAST:
+            # Test 1 and the logic tests gate Tests 4-7, no point waiting on the LLM if they failed
+            passed = await asyncio.gather(*prerequisites)
+            if logic_ok and all(passed):
+                await self._run_apply_tests()
+            else:
+                print("⛔ FAIL_FAST: a prerequisite test failed, skipping the apply-mode tests\n")
+        else:
+            # Every request is independent, so they are all in flight at once and the run takes
+            # as long as the slowest LLM call: Test 1 AI Service Integration, the live logic
+            # tests, and Tests 4-7 Visual, Content, Custom Prompt, Chat Interactive
+            await asyncio.gather(*prerequisites, self._run_apply_tests())
         
         # Generate Summary
         self.generate_summary()
+        
+        self.session.close()
+
+    def _elapsed(self, result: dict) -> float:
+        """Seconds from the start of the run until a result was logged"""
+        return (result["t_ns"] - self._start_ns) / 1e9
 
     def generate_summary(self):
         """Generate test summary"""
@@ -473,16 +471,16 @@ class DirectEnhancementTester:
             print("❌ FAILED TESTS:")
             for result in self.test_results:
                 if not result["success"]:
-                    print(f"   • {result['test']}: {result['error']}")
+                    print(f"   • {result['test']} (+{self._elapsed(result):.2f}s): {result['error']}")
             print()
         
         print("✅ PASSED TESTS:")
         for result in self.test_results:
             if result["success"]:
-                print(f"   • {result['test']}")
+                print(f"   • {result['test']} (+{self._elapsed(result):.2f}s)")
         
         print("\n" + "=" * 70)
 
 if __name__ == "__main__":
     tester = DirectEnhancementTester()
-    tester.run_all_tests()
\ No newline at end of file
+    asyncio.run(tester.run_all_tests())
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+Shared request helpers for the AI enhancement test scripts
+"""
+
+import contextlib
+import functools
+import os
+import random
+import threading
+from pathlib import Path
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+FIXTURES_DIR = Path(__file__).resolve().parents[1] / "tests" / "fixtures"
+
+# The page every enhancement test sends as current_content
+SAMPLE_HTML = """
+<!DOCTYPE html>
+<html>
+<head><title>Test Website</title></head>
+<body>
+    <h1>Welcome to TechCorp</h1>
+    <p>We are a software development company.</p>
+    <button>Contact Us</button>
+</body>
+</html>
+"""
+
+# ENHANCE_MOCK_LOGIC=1 answers the suggestions and priority tests from canned fixtures, for
+# offline runs that only exercise the client side. By default they hit the live backend,
+# which is the only way they check the server's apply-over-enhancement_type routing
+MOCK_LOGIC = bool(os.environ.get("ENHANCE_MOCK_LOGIC"))
+
+class _JitteredRetry(Retry):
+    """Retry whose exponential backoff is spread by up to 50% so concurrent tests don't retry in lockstep"""
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, backoff / 2) if backoff else 0
+
+# Idempotent requests retry transient gateway errors and rate limits (honouring Retry-After)
+# and a read timeout once. POSTs generate, seed or enhance projects and write to the database,
+# so they are left out of allowed_methods: one that reached the server is never re-sent, and
+# only a connection that could not be opened is retried. The final error response is returned
+# rather than raised so tests report it like any other HTTP status
+RETRY = _JitteredRetry(total=3, read=1, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+                       allowed_methods=Retry.DEFAULT_ALLOWED_METHODS, respect_retry_after_header=True,
+                       raise_on_status=False)
+
+# Sent with every pre-encoded JSON body
+COMMON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json", "Connection": "keep-alive"}
+
+def make_session() -> requests.Session:
+    """A pooled keep-alive session that retries through RETRY"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=RETRY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def json_body(response):
+    """Decode a JSON response body with orjson, leaving other content types to requests"""
+    if response.headers.get("content-type", "").startswith("application/json"):
+        return orjson.loads(response.content)
+    return response.json()
+
+# Only one thread fetches the providers, the others wait for its response
+_providers_lock = threading.Lock()
+
+def get_providers(session: requests.Session, api_url: str):
+    """Return (status, data) of GET /ai-providers, requested once per process"""
+    with _providers_lock:
+        status, data = _fetch_providers(session, api_url)
+        if status != 200:
+            # A failed lookup is evicted so the next provider check asks the backend again
+            _fetch_providers.cache_clear()
+        return status, data
+
+@functools.lru_cache(maxsize=1)
+def _fetch_providers(session: requests.Session, api_url: str):
+    """Fetch /ai-providers; connection errors raise and non-200 results are evicted by get_providers"""
+    response = session.get(f"{api_url}/ai-providers", timeout=10)
+    return response.status_code, json_body(response) if response.status_code == 200 else None
+
+@contextlib.contextmanager
+def logic_mock(url: str, fixture: str):
+    """Answer POSTs to url with tests/fixtures/<fixture>.json while active (a no-op unless MOCK_LOGIC)"""
+    if not MOCK_LOGIC:
+        yield
+        return
+    
+    import responses  # only needed while mocking
+    
+    with responses.RequestsMock() as mock:
+        mock.add(responses.POST, url, body=(FIXTURES_DIR / f"{fixture}.json").read_bytes(),
+                 content_type="application/json")
+        yield
@@ -0,0 +1,22 @@
+"""
+Shared environment lookups for the backend test scripts
+"""
+
+import functools
+from pathlib import Path
+
+FRONTEND_ENV = Path('/app/frontend/.env')
+
+# The FastAPI app and its database service, importable once this is on sys.path
+BACKEND_DIR = Path(__file__).resolve().parents[1] / "backend"
+
+@functools.lru_cache(maxsize=1)
+def load_backend_url() -> str:
+    """Read REACT_APP_BACKEND_URL from the frontend .env once per process"""
+    # Stop reading at the first matching line; partition splits only on the first '='
+    with FRONTEND_ENV.open() as f:
+        try:
+            return next(line.partition('=')[2].strip() for line in f 
+                        if line.startswith('REACT_APP_BACKEND_URL='))
+        except StopIteration:
+            raise RuntimeError(f"REACT_APP_BACKEND_URL missing from {FRONTEND_ENV}") from None
@@ -0,0 +1,36 @@
+"""
+Shared aiohttp session for the backend test scripts
+"""
+
+import asyncio
+
+import aiohttp
+
+POOL_LIMIT = 20
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+_session: aiohttp.ClientSession = None
+
+def get_session() -> aiohttp.ClientSession:
+    """Return the shared session, opening it on first use inside the running event loop"""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit=POOL_LIMIT, limit_per_host=POOL_LIMIT)
+        _session = aiohttp.ClientSession(connector=connector, timeout=DEFAULT_TIMEOUT)
+    return _session
+
+async def close_session():
+    """Close the shared session; the next get_session() opens a fresh one"""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+def run(coro):
+    """asyncio.run() a test entry point, closing the shared session before the loop goes away"""
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await close_session()
+    return asyncio.run(runner())
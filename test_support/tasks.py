@@ -0,0 +1,21 @@
+"""
+Bounded concurrency for the async test harnesses
+"""
+
+import asyncio
+import os
+
+# Match Motor's worker pool so fanned-out tests don't queue up behind it
+MAX_CONCURRENCY = int(os.getenv('MOTOR_MAX_WORKERS', '5'))
+
+async def run_bounded(*coros, limit: int = MAX_CONCURRENCY):
+    """Run coroutines concurrently in a TaskGroup, at most `limit` at a time"""
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+    
+    async with asyncio.TaskGroup() as group:
+        tasks = [group.create_task(bounded(coro)) for coro in coros]
+    return [task.result() for task in tasks]
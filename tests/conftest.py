@@ -0,0 +1,71 @@
+"""
+Shared fixtures for the pytest suites under tests/
+"""
+
+import sys
+
+import pytest
+import pytest_asyncio
+import requests
+
+from test_support.enhance import SAMPLE_HTML, make_session
+from test_support.env import BACKEND_DIR, FRONTEND_ENV, load_backend_url
+from test_support.http import close_session, get_session
+
+@pytest.fixture(scope="session")
+def api_url():
+    """Base URL of the backend API under test"""
+    if not FRONTEND_ENV.exists():
+        pytest.skip(f"{FRONTEND_ENV} not found, backend URL unknown")
+    return f"{load_backend_url()}/api"
+
+@pytest.fixture(scope="session")
+def session():
+    """One pooled, retrying requests session for every synchronous HTTP test in the worker"""
+    session = make_session()
+    yield session
+    session.close()
+
+@pytest.fixture(scope="session")
+def provider_info(session, api_url):
+    """The decoded GET /ai-providers response, fetched once per worker"""
+    try:
+        response = session.get(f"{api_url}/ai-providers", timeout=10)
+    except requests.ConnectionError as e:
+        pytest.skip(f"Backend not reachable: {e}")
+    assert response.status_code == 200, f"Could not verify AI providers: HTTP {response.status_code}"
+    return response.json()
+
+@pytest.fixture
+def sample_html():
+    """The page every direct enhancement test sends as current_content"""
+    return SAMPLE_HTML
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client():
+    """One pooled aiohttp session for every HTTP test in the worker"""
+    yield get_session()
+    await close_session()
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_service():
+    """A DatabaseService connected once per worker and shared by every DB test"""
+    pytest.importorskip("motor")
+    pytest.importorskip("pydantic")
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+    
+    from dotenv import load_dotenv
+    from database import DatabaseService
+    
+    load_dotenv(BACKEND_DIR / ".env")
+    service = DatabaseService()
+    await service.connect()
+    try:
+        await service.client.admin.command('ping')
+    except Exception as e:
+        await service.close()
+        pytest.skip(f"MongoDB not reachable: {e}")
+    
+    yield service
+    await service.close()
@@ -0,0 +1,125 @@
+"""
+AI enhancement tests for POST /api/enhance-project with apply=true
+
+Every test here shares one generated project, so under xdist --dist loadfile keeps this
+file on a single worker (generating the project once) while other files run in parallel:
+    pytest -n auto --dist loadfile tests
+"""
+
+import orjson
+import pytest
+import requests
+
+from test_ai_enhancement import (
+    AIEnhancementTester,
+    APPLY_MODE_ENHANCEMENTS,
+    CONTENT_ENHANCEMENT,
+    _file_digests,
+    _html_file,
+    _index_files
+)
+from test_support.enhance import COMMON_HEADERS
+
+TIMEOUTS = AIEnhancementTester.TIMEOUTS
+
+PRIORITY_ENHANCEMENT = {
+    "type": "performance",
+    "title": "Optimización SEO",
+    "description": "Mejorar meta tags, estructura semántica y rendimiento para mejor posicionamiento",
+    "impact": "medium",
+    "icon": "🚀"
+}
+
+@pytest.fixture(scope="session")
+def project_data(session, api_url):
+    """A generated project shared by every test in the worker"""
+    payload = {
+        "prompt": "Create a professional landing page for TechCorp, a software development company specializing in web applications",
+        "website_type": "landing",
+        "provider": "openai"
+    }
+    try:
+        response = session.post(f"{api_url}/generate-website", data=orjson.dumps(payload),
+                                headers=COMMON_HEADERS, timeout=TIMEOUTS["generate"])
+    except requests.RequestException as e:
+        pytest.skip(f"Backend not reachable: {e}")
+    
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data.get("success"), data
+    
+    files = _index_files(data.get("files"))
+    _, html_content = _html_file(files)
+    return {
+        "project_id": data["project_id"],
+        "files": files,
+        "html_content": html_content
+    }
+
+def _enhance(session, api_url, project_data, fields, timeout):
+    """POST an enhancement for the shared project and return the decoded body"""
+    payload = {
+        "project_id": project_data["project_id"],
+        "current_content": project_data["html_content"],
+        **fields
+    }
+    response = session.post(f"{api_url}/enhance-project", data=orjson.dumps(payload), 
+                            headers=COMMON_HEADERS, timeout=timeout)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_ai_service_integration(session, api_url):
+    """The OpenAI provider used for enhancements is configured with a GPT-4 model"""
+    response = session.get(f"{api_url}/ai-providers", timeout=TIMEOUTS["ai_providers"])
+    assert response.status_code == 200
+    
+    providers = response.json().get("providers", [])
+    openai_provider = next((p for p in providers if p.get("id") == "openai"), None)
+    assert openai_provider, "OpenAI provider not found"
+    assert "gpt-4" in openai_provider.get("model", "").lower()
+
+def test_suggestions_mode(session, api_url, project_data):
+    """apply=false returns enhancement suggestions"""
+    data = _enhance(session, api_url, project_data,
+                    {"enhancement_type": "suggestions", "apply": False}, TIMEOUTS["enhance_suggest"])
+    
+    assert data.get("success"), data
+    assert len(data.get("suggestions", [])) > 0
+
+@pytest.mark.parametrize("enhancement, mod_type", [
+    pytest.param(enhancement, mod_type, id=name) for name, mod_type, enhancement in APPLY_MODE_ENHANCEMENTS
+])
+def test_apply_mode(session, api_url, project_data, enhancement, mod_type):
+    """apply=true returns the enhanced project files"""
+    data = _enhance(session, api_url, project_data,
+                    {"enhancement": enhancement, "apply": True, "modification_type": mod_type},
+                    TIMEOUTS["enhance_apply"])
+    
+    assert data.get("success"), data.get("error")
+    assert len(data["enhanced_project"].get("files", {})) > 0
+
+def test_priority_logic(session, api_url, project_data):
+    """apply=true takes priority over enhancement_type=suggestions"""
+    data = _enhance(session, api_url, project_data,
+                    {"enhancement": PRIORITY_ENHANCEMENT, "enhancement_type": "suggestions", "apply": True},
+                    TIMEOUTS["enhance_apply"])
+    
+    assert data.get("success"), data.get("error")
+    assert "enhanced_project" in data
+    assert "suggestions" not in data
+
+def test_database_updated(session, api_url, project_data):
+    """An applied enhancement is persisted to the stored project"""
+    response = session.get(f"{api_url}/projects/{project_data['project_id']}", timeout=TIMEOUTS["get_project"])
+    assert response.status_code == 200
+    original_hashes = _file_digests(response.json().get("files"))
+    
+    _enhance(session, api_url, project_data,
+             {"enhancement": CONTENT_ENHANCEMENT, "apply": True, "modification_type": "enhancement"},
+             TIMEOUTS["enhance_apply"])
+    
+    response = session.get(f"{api_url}/projects/{project_data['project_id']}", timeout=TIMEOUTS["get_project"])
+    assert response.status_code == 200
+    updated_hashes = _file_digests(response.json().get("files"))
+    
+    assert any(updated_hashes.get(name) not in (None, digest) for name, digest in original_hashes.items())
@@ -0,0 +1,52 @@
+"""
+Direct database tests for project deletion
+"""
+
+import uuid
+
+import pytest
+
+from test_support.env import BACKEND_DIR
+
+# Async tests share the session-scoped event loop the db_service fixture lives on
+asyncio_session = pytest.mark.asyncio(loop_scope="session")
+
+@asyncio_session
+async def test_database_connection(db_service):
+    """The shared connection answers a ping"""
+    result = await db_service.client.admin.command('ping')
+    assert result.get("ok") == 1
+
+@asyncio_session
+async def test_delete_project_function(db_service):
+    """delete_project removes a freshly saved project"""
+    project_id = str(uuid.uuid4())
+    await db_service.save_project({
+        "success": True,
+        "session_id": project_id,
+        "files": {
+            "index.html": "<html><body><h1>Test Project for Deletion</h1></body></html>",
+            "styles.css": "body { font-family: Arial; }"
+        },
+        "metadata": {
+            "provider": "test",
+            "website_type": "landing",
+            "prompt": "Test project for deletion testing"
+        }
+    })
+    
+    assert await db_service.delete_project(project_id) is True
+    assert await db_service.get_project(project_id) is None
+
+@asyncio_session
+async def test_delete_nonexistent_project(db_service):
+    """delete_project reports False for an unknown id"""
+    assert await db_service.delete_project("nonexistent-project-12345") is False
+
+def test_api_endpoint_structure():
+    """server.py wires the DELETE route to the database service"""
+    server_content = (BACKEND_DIR / "server.py").read_text()
+    
+    assert '@api_router.delete("/projects/{project_id}")' in server_content
+    assert 'async def delete_project(project_id: str' in server_content
+    assert 'await db_service.delete_project(project_id)' in server_content
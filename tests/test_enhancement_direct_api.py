@@ -0,0 +1,132 @@
+"""
+Direct enhance-project tests, ported from DirectEnhancementTester
+
+The suggestions and priority tests hit the live backend; ENHANCE_MOCK_LOGIC=1 answers them from tests/fixtures.
+Every apply-mode case is its own test item, so xdist can shard them across workers:
+    pytest -n auto -k apply_mode tests/test_enhancement_direct_api.py
+"""
+
+import contextlib
+import uuid
+
+import pytest
+import requests
+
+from test_support.env import FRONTEND_ENV
+
+# The direct enhancement module resolves the backend URL on import
+if not FRONTEND_ENV.exists():
+    pytest.skip(f"{FRONTEND_ENV} not found, backend URL unknown", allow_module_level=True)
+
+from test_enhancement_direct import (
+    ENHANCEMENT_CASES,
+    PRIORITY_ENHANCEMENT,
+    _APPLY_READ_TIMEOUT
+)
+from test_support.enhance import logic_mock
+
+@pytest.fixture
+def enhance_mock(api_url):
+    """Answer /enhance-project with tests/fixtures/<name>.json while the test runs, only when ENHANCE_MOCK_LOGIC=1"""
+    with contextlib.ExitStack() as stack:
+        yield lambda name: stack.enter_context(logic_mock(f"{api_url}/enhance-project", name))
+
+def _enhance(session, api_url, sample_html, fields, timeout):
+    """POST an enhancement for the sample page and return the decoded body"""
+    payload = {
+        "project_id": str(uuid.uuid4()),
+        "current_content": sample_html,
+        **fields
+    }
+    
+    try:
+        response = session.post(f"{api_url}/enhance-project", json=payload, timeout=(5, timeout))
+    except requests.ConnectionError as e:
+        pytest.skip(f"Backend not reachable: {e}")
+    
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_ai_service_integration(provider_info):
+    """The OpenAI provider used for enhancements is configured with a GPT-4 model"""
+    providers = provider_info.get("providers", [])
+    openai_provider = next((p for p in providers if p.get("id") == "openai"), None)
+    assert openai_provider, "OpenAI provider not found"
+    assert "gpt-4" in openai_provider.get("model", "").lower()
+
+def test_suggestions_mode(session, api_url, sample_html, enhance_mock):
+    """apply=false returns enhancement suggestions"""
+    enhance_mock("enhance_project_suggestions")
+    data = _enhance(session, api_url, sample_html, 
+                    {"enhancement_type": "suggestions", "apply": False}, timeout=30)
+    
+    assert data.get("success"), data
+    assert len(data.get("suggestions", [])) > 0
+
+def test_priority_logic(session, api_url, sample_html, enhance_mock):
+    """apply=true takes priority over enhancement_type=suggestions"""
+    enhance_mock("enhance_project_applied")
+    data = _enhance(session, api_url, sample_html, 
+                    {"enhancement": PRIORITY_ENHANCEMENT, "enhancement_type": "suggestions", "apply": True}, 
+                    timeout=_APPLY_READ_TIMEOUT)
+    
+    assert data.get("success"), data.get("error")
+    assert "enhanced_project" in data
+    assert "suggestions" not in data
+
+@pytest.mark.parametrize("label, enhancement, mod_type, required_files", [
+    pytest.param(*case, id=case[0]) for case in ENHANCEMENT_CASES
+])
+def test_apply_mode(session, api_url, sample_html, label, enhancement, mod_type, required_files):
+    """apply=true returns an enhanced project with the essential files"""
+    data = _enhance(session, api_url, sample_html, 
+                    {"enhancement": enhancement, "apply": True, "modification_type": mod_type}, 
+                    timeout=_APPLY_READ_TIMEOUT)
+    
+    assert data.get("success"), data.get("error")
+    
+    enhanced_files = data["enhanced_project"].get("files", {})
+    assert len(enhanced_files) > 0
+    for ext in required_files:
+        assert any(ext in f.lower() for f in enhanced_files), f"No {ext} file in {list(enhanced_files)}"
+
+def test_apply_mode_batch(session, api_url, sample_html):
+    """/enhance-project-batch applies every case and returns the results in request order"""
+    payload = {
+        "current_content": sample_html,
+        "batch": [
+            {"project_id": str(uuid.uuid4()), "enhancement": enhancement, "modification_type": mod_type}
+            for _, enhancement, mod_type, _ in ENHANCEMENT_CASES
+        ],
+        "apply": True
+    }
+    
+    try:
+        response = session.post(f"{api_url}/enhance-project-batch", json=payload, 
+                                timeout=(5, 2 * _APPLY_READ_TIMEOUT))
+    except requests.ConnectionError as e:
+        pytest.skip(f"Backend not reachable: {e}")
+    
+    assert response.status_code == 200, response.text
+    results = response.json().get("results", [])
+    assert len(results) == len(ENHANCEMENT_CASES)
+    
+    for job, result in zip(payload["batch"], results):
+        assert result.get("success"), result.get("error")
+        assert result["enhanced_project"]["id"] == job["project_id"]
+
+def test_apply_mode_batch_size_limit(session, api_url, sample_html):
+    """/enhance-project-batch rejects a batch over its job limit without running any job"""
+    job = {"project_id": str(uuid.uuid4()), "enhancement": PRIORITY_ENHANCEMENT}
+    payload = {"current_content": sample_html, "batch": [job] * 9, "apply": True}
+    
+    try:
+        response = session.post(f"{api_url}/enhance-project-batch", json=payload, timeout=(5, 10))
+    except requests.ConnectionError as e:
+        pytest.skip(f"Backend not reachable: {e}")
+    
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert not data.get("success")
+    assert "limited to" in data.get("error", "")
+    assert "results" not in data
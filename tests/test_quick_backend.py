@@ -0,0 +1,37 @@
+"""
+Quick API tests for the core endpoints, without AI generation
+"""
+
+from datetime import datetime
+
+import pytest
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+@pytest.mark.parametrize("endpoint, key", [
+    ("/", "message"),
+    ("/ai-providers", "providers"),
+    ("/website-types", "types"),
+    ("/projects", "projects"),
+    ("/templates", "categories")
+])
+async def test_get_endpoint(http_client, api_url, endpoint, key):
+    """Read-only endpoints answer 200 with their expected payload"""
+    async with http_client.get(f"{api_url}{endpoint}") as response:
+        assert response.status == 200
+        data = await response.json()
+    
+    assert key in data
+
+async def test_status_roundtrip(http_client, api_url):
+    """A status check written through the API can be read back"""
+    payload = {
+        "status": "quick_test",
+        "timestamp": datetime.now().isoformat()
+    }
+    async with http_client.post(f"{api_url}/status", json=payload) as response:
+        assert response.status == 200
+    
+    async with http_client.get(f"{api_url}/status") as response:
+        assert response.status == 200
+        assert isinstance(await response.json(), list)